@@ -1,13 +1,35 @@
 #!/usr/bin/env python
 
+import re
+
 import conserve
-from packaging.requirements import Requirement
+
+# Fast path for the common `name` / `name<op><release>` shapes only; anything else
+# (extras, markers, URLs, several specifiers, pre/post/local versions) goes to `packaging`
+_SIMPLE_REQ = re.compile(
+    r"^([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*"
+    r"((?:==|!=|<=|>=|<|>)\s*[0-9]+(?:\.[0-9]+)*|~=\s*[0-9]+(?:\.[0-9]+)+)?\s*$"
+)
+
+
+def _parse_requirement(dep_spec: str) -> tuple[str, str]:
+    """Return (name, specifier) with `str(Requirement(...).specifier)` semantics."""
+    m = _SIMPLE_REQ.match(dep_spec)
+    if m:
+        spec = m.group(2)
+        # A single specifier renders without whitespace
+        return m.group(1), "".join(spec.split()) if spec else "*"
+
+    from packaging.requirements import Requirement
+
+    req = Requirement(dep_spec)
+    return req.name, str(req.specifier) or "*"
 
 
 def conserve_sync_dependencies():
     """Sync dependencies from @pyproject.toml to @pixi.toml using package.pypi_to_conda mapping."""
 
-    pyproject = conserve.TOMLHandle("pyproject.toml").load().read()
+    pyproject = conserve.TOMLHandle("pyproject.toml").load().read_fast()
 
     # Get PyPI dependencies
     pypi_deps = pyproject.get("project", {}).get("dependencies", [])
@@ -15,27 +37,21 @@ def conserve_sync_dependencies():
         print("No dependencies found in pyproject.toml")
         return
 
-    # Parse and categorize dependencies
+    # Parse all requirements first, then map names in a single batch
+    parsed = [_parse_requirement(dep_spec) for dep_spec in pypi_deps]
+    conda_names = conserve.package.pypi_to_conda_many([name for name, _ in parsed])
+
+    # Categorize: packages with a Conda mapping vs PyPI-only
     conda_deps = {}
     pypi_only_deps = {}
-
-    for dep_spec in pypi_deps:
-        req = Requirement(dep_spec)
-        pkg_name = req.name
-        version = str(req.specifier) or "*"
-
-        # Try PyPI to Conda conversion (now handles normalization internally)
-        conda_name = conserve.package.pypi_to_conda(pkg_name)
-
+    for (pkg_name, version), conda_name in zip(parsed, conda_names):
         if conda_name:
-            # Package exists in Conda (with mapped or same name)
             conda_deps[conda_name] = version
         else:
-            # Package only exists in PyPI
             pypi_only_deps[pkg_name] = version
 
-    # Apply - merge preserves existing entries like python, pip, conserve
-    conserve.TOMLHandle("pixi.toml").load().merge(
+    # Apply - merge preserves existing entries like python, pip, conserve; unchanged keys are untouched
+    conserve.TOMLHandle("pixi.toml").load().diff_merge(
         {
             "dependencies": conda_deps,
             "pypi-dependencies": pypi_only_deps,
@@ -1,30 +1,68 @@
-import json
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import msgspec
 import schemastore
-from datamodel_code_generator import DataModelType, InputFileType, PythonVersion, generate
 
-from conserve.file import to_valid_filename
+from conserve.file import File, to_valid_filename
+
+
+# Schemas change rarely; reuse the on-disk copy for a day
+SCHEMA_TTL = 24 * 60 * 60
+
+
+def fetch_schema(url: str) -> dict:
+    """Fetch schema JSON through conserve's on-disk URL cache (see `File.cache`)."""
+    return msgspec.json.decode(File(url).cache(ttl=SCHEMA_TTL).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _catalog_urls() -> dict[str, str]:
+    """Lowercased schema name -> URL, built once from the schemastore catalog (first entry wins)."""
+    urls: dict[str, str] = {}
+    for schema in schemastore._Store().catalog.get("schemas", []):
+        url = schema.get("url")
+        if url:
+            urls.setdefault(schema.get("name", "").lower(), url)
+    return urls
 
 
 def query_schema(name: str) -> dict | None:
-    """Query schema by name from schemastore catalog."""
-    store = schemastore._Store()
-    registry = schemastore.registry()
-
-    # Search by name (case-insensitive, with/without extensions)
-    for schema in store.catalog.get("schemas", []):
-        schema_name = schema.get("name", "")
-        # Try exact match or case-insensitive match
-        if schema_name == name or schema_name.lower() == name.lower():
-            url = schema.get("url")
-            if url:
-                try:
-                    return registry.get_or_retrieve(url).value.contents  # type: ignore[no-any-return]
-                except Exception:
-                    return None
-    return None
+    """Query schema by name from schemastore catalog (case-insensitive)."""
+    url = _catalog_urls().get(name.lower())
+    if not url:
+        return None
+    try:
+        return fetch_schema(url)
+    except (OSError, ValueError, msgspec.DecodeError):
+        # Fall back to the registry retriever (uncached)
+        pass
+    try:
+        return schemastore.registry().get_or_retrieve(url).value.contents  # type: ignore[no-any-return]
+    except Exception:
+        return None
+
+
+def _generate_model(name: str, content: dict) -> None:
+    """Generate one pydantic module for a schema."""
+    # Heavy import (pydantic, jinja2, black): only pay for it when generating
+    from datamodel_code_generator import DataModelType, InputFileType, PythonVersion, generate
+
+    # Convert name to valid Python filename
+    module_name = to_valid_filename(name)
+
+    # Feed the schema as raw JSON text: no temp file round-trip
+    generate(
+        input_=msgspec.json.encode(content).decode(),
+        input_file_type=InputFileType.JsonSchema,
+        output=Path("src/conserve/model") / f"{module_name}.py",
+        output_model_type=DataModelType.PydanticV2BaseModel,
+        target_python_version=PythonVersion.PY_312,
+        use_union_operator=True,  # Use | instead of Union
+        collapse_root_models=False,  # Keep structure for complex schemas
+        use_default_kwarg=True,  # Use default= instead of default_factory=
+    )
 
 
 def conserve_generate_models() -> None:
@@ -32,32 +70,21 @@ def conserve_generate_models() -> None:
 
     names = ["pixi.toml", "Claude Code Settings"]
 
-    for name in names:
-        content = query_schema(name)
+    # Fetches are network-bound and independent: overlap them (catalog index built once, up front)
+    _catalog_urls()
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+        contents = list(executor.map(query_schema, names))
 
+    pairs = []
+    for name, content in zip(names, contents):
         if not content:
             print(f"Schema for {name} not found, skipping model generation.")
             continue
+        pairs.append((name, content))
+
+    if not pairs:
+        return
 
-        # Write schema to temporary file for datamodel-code-generator
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(content, f, indent=2)
-            schema_path = f.name
-
-        try:
-            # Convert name to valid Python filename
-            module_name = to_valid_filename(name)
-
-            generate(
-                input_=Path(schema_path),
-                input_file_type=InputFileType.JsonSchema,
-                output=Path("src/conserve/model") / f"{module_name}.py",
-                output_model_type=DataModelType.PydanticV2BaseModel,
-                target_python_version=PythonVersion.PY_312,
-                use_union_operator=True,  # Use | instead of Union
-                collapse_root_models=False,  # Keep structure for complex schemas
-                use_default_kwarg=True,  # Use default= instead of default_factory=
-            )
-        finally:
-            # Clean up temp file
-            Path(schema_path).unlink(missing_ok=True)
+    # Schemas are independent (distinct outputs), generate them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+        list(executor.map(lambda pair: _generate_model(*pair), pairs))
@@ -1,13 +1,9 @@
 """CLI interface for Conserve."""
 
-import inspect
 import sys
-import traceback
 from pathlib import Path
 
-import tyro
-
-from .discovery import discover_all_tasks
+from .discovery import discover_all_tasks_cached, resolve_tasks
 from .plan import plan
 
 
@@ -15,7 +11,7 @@ def list_tasks(root: Path | None = None) -> None:
     root = root or Path.cwd()
     print(f"Discovering tasks in: {root}\n")
 
-    tasks = discover_all_tasks(root)
+    tasks = discover_all_tasks_cached(root)
     if not tasks:
         print("No conserve tasks found.")
         print("\nExpected locations:")
@@ -25,23 +21,24 @@ def list_tasks(root: Path | None = None) -> None:
         return
 
     print(f"Found {len(tasks)} task(s):\n")
-    for task_id, _ in tasks:
-        print(f"  {task_id}")
+    for ref in tasks:
+        print(f"  {ref.task_id}")
 
 
-def info(task: str, root: Path | None = None) -> None:
+def info(task: str, root: Path | None = None, source: bool = False) -> None:
+    """Show task docstring and location; pass --source to print its source."""
     root = root or Path.cwd()
 
-    all_tasks = discover_all_tasks(root)
+    all_tasks = discover_all_tasks_cached(root)
 
-    # Find matching task
-    matches = [(tid, func) for tid, func in all_tasks if tid == task or tid.endswith(f":{task}")]
+    # Find matching task (only matches get imported)
+    matches = [ref for ref in all_tasks if ref.task_id == task or ref.task_id.endswith(f":{task}")]
 
     if not matches:
         print(f"Task not found: {task}")
         return
 
-    for task_id, func in matches:
+    for task_id, func in resolve_tasks(matches):
         print(f"Task: {task_id}")
         print(f"Module: {task_id.split(':')[0]}")
         print(f"Function: {func.__name__}")
@@ -49,12 +46,15 @@ def info(task: str, root: Path | None = None) -> None:
         if func.__doc__:
             print(f"\nDocstring:\n{func.__doc__}")
 
-        source_file = inspect.getfile(func)
-        source_lines, line_num = inspect.getsourcelines(func)
-        print(f"\nSource: {source_file}:{line_num}")
-        print("".join(source_lines[:10]))  # Show first 10 lines
-        if len(source_lines) > 10:
-            print(f"... ({len(source_lines) - 10} more lines)")
+        # Location comes from the code object; no source tokenizing needed
+        print(f"\nSource: {func.__code__.co_filename}:{func.__code__.co_firstlineno}")
+        if source:
+            import inspect
+
+            source_lines, _ = inspect.getsourcelines(func)
+            print("".join(source_lines[:10]))  # Show first 10 lines
+            if len(source_lines) > 10:
+                print(f"... ({len(source_lines) - 10} more lines)")
 
 
 def apply(
@@ -69,7 +69,7 @@ def apply(
     # Clear plan state to start fresh
     plan.clear()
 
-    all_tasks = discover_all_tasks(root)
+    all_tasks = discover_all_tasks_cached(root)
     if not all_tasks:
         print("No conserve tasks found.")
         return
@@ -80,7 +80,7 @@ def apply(
         for task_pattern in tasks:
             # Support partial matching (just function name)
             matches = [
-                (tid, func) for tid, func in all_tasks if tid == task_pattern or tid.endswith(f":{task_pattern}")
+                ref for ref in all_tasks if ref.task_id == task_pattern or ref.task_id.endswith(f":{task_pattern}")
             ]
             if not matches:
                 print(f"Warning: No task matching '{task_pattern}'")
@@ -95,17 +95,19 @@ def apply(
     # Execute tasks (they will stage changes to plan)
     if dry_run:
         print(f"[DRY RUN] Would run {len(tasks_to_run)} task(s):\n")
-        for task_id, func in tasks_to_run:
-            print(f"  → {task_id}")
+        for ref in tasks_to_run:
+            print(f"  → {ref.task_id}")
         print("\nNo changes were applied.")
         return
 
     print(f"Running {len(tasks_to_run)} task(s)...\n")
-    for task_id, func in tasks_to_run:
+    for task_id, func in resolve_tasks(tasks_to_run):
         print(f"  → {task_id}")
         try:
             func()
         except Exception as e:
+            import traceback
+
             print(f"    ✗ Failed: {e}")
             traceback.print_exc(limit=3)
             plan.rollback()
@@ -154,9 +156,13 @@ def apply(
         plan.rollback()
 
 
-def main() -> None:
-    """Conserve - Configuration fragment synchronizer."""
-    if len(sys.argv) < 2:
+def main(argv: list[str] | None = None) -> None:
+    """Conserve - Configuration fragment synchronizer.
+
+    `argv` defaults to `sys.argv[1:]`; pass it to drive the CLI in-process.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
         print("Usage: conserve <command> [options]")
         print("\nCommands:")
         print("  apply             Apply changes with preview (default)")
@@ -164,11 +170,14 @@ def main() -> None:
         print("  info <task>       Show information about a task")
         sys.exit(1)
 
-    command = sys.argv[1]
+    command = argv[0]
     commands = {"list": list_tasks, "apply": apply, "info": info}
 
     if command in commands:
-        tyro.cli(commands[command], args=sys.argv[2:])
+        # Deferred: tyro pulls in rich/docstring-parser, unneeded for early exits
+        import tyro
+
+        tyro.cli(commands[command], args=argv[1:])
     else:
         print(f"Unknown command: {command}")
         print("Use 'conserve --help' for usage information")
@@ -1,72 +1,143 @@
 """Configuration file handles for structured formats (YAML/JSON/TOML)."""
 
+import copy
 import json as json_lib
+import threading
+import tomllib
+from dataclasses import dataclass
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import Self
 
+import msgspec
 import tomlkit
-from deepmerge import Merger
 from ruamel.yaml import YAML
 
 # Import special types for format-preserving merge
-from ruamel.yaml.comments import CommentedMap
 from tomlkit.items import Table as TOMLTable
 from tomlkit.toml_document import TOMLDocument
 
-from .core import BaseHandle
+from .core import BaseHandle, _cache_put
 from .file import File
 
 
-def format_preserving_merge(config, path, base, nxt):
-    """Merge strategy that preserves formatting for TOML and YAML."""
-    for key, value in nxt.items():
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated path (cached; the same paths recur across calls)."""
+    return tuple(path.split("."))
+
+
+# Exact container types that take the multiline-array rule (O(1) type probe, no MRO walk)
+_TOML_CONTAINERS = frozenset({TOMLDocument, TOMLTable})
+
+
+def _wants_multiline(container, value) -> bool:
+    """TOML lists with more than 2 items are written as multiline arrays."""
+    return type(container) in _TOML_CONTAINERS and isinstance(value, list) and len(value) > 2
+
+
+def _toml_multiline_array(value: list):
+    """Build a multiline tomlkit array from a plain list."""
+    arr = tomlkit.array()
+    arr.multiline(True)
+    for item in value:
+        arr.append(item)
+    return arr
+
+
+def _merge(base, patch):
+    """Deep merge patch into base in place and return the result.
+
+    Dicts merge recursively; lists and scalars (and type conflicts) are
+    replaced. Format-preserving containers keep their own item types, and
+    TOML lists longer than 2 items become multiline arrays.
+    """
+    if not (isinstance(base, dict) and isinstance(patch, dict)):
+        return patch
+    toml = type(base) in _TOML_CONTAINERS
+    for key, value in patch.items():
+        if key in base:
+            current = base[key]
+            if isinstance(current, dict) and isinstance(value, dict):
+                base[key] = _merge(current, value)
+                continue
+            if toml and isinstance(value, list) and len(value) > 2:
+                base[key] = _toml_multiline_array(value)
+                continue
+        base[key] = value
+    return base
+
+
+def _needs_merge(base, patch: dict) -> bool:
+    """Return True if deep-merging patch into base would change anything."""
+    for key, value in patch.items():
         if key not in base:
+            return True
+        current = base[key]
+        if isinstance(current, dict) and isinstance(value, dict):
+            if current != value and _needs_merge(current, value):
+                return True
+        elif current != value:
+            return True
+    return False
+
+
+def _diff_merge_into(base, patch: dict) -> None:
+    """Deep-merge patch into base in place, assigning only differing keys."""
+    for key, value in patch.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            if current != value:
+                _diff_merge_into(current, value)
+        elif key not in base:
             base[key] = value
-        else:
-            # Special handling for TOML lists to preserve multiline format
-            if isinstance(base, (TOMLDocument, TOMLTable)) and isinstance(value, list) and len(value) > 2:
-                arr = tomlkit.array()
-                arr.multiline(True)
-                for item in value:
-                    arr.append(item)
-                base[key] = arr
-            else:
-                # Recursively merge nested structures
-                base[key] = config.value_strategy(path + [key], base[key], value)
-    return base
+        elif current != value:
+            # Same rule as `_merge`: only replaced lists become multiline arrays
+            base[key] = _toml_multiline_array(value) if _wants_multiline(base, value) else value
+
 
+def _merge_copy(base, patch: dict):
+    """Deep merge without mutating inputs; only containers on merged paths are copied.
 
-# Configure merger according to spec: dict recursive, list/scalar replace
-conserve_merger = Merger(
-    [
-        # Format-preserving strategies (higher priority)
-        (TOMLDocument, format_preserving_merge),
-        (TOMLTable, format_preserving_merge),
-        (CommentedMap, format_preserving_merge),
-        # Standard strategies
-        (dict, ["merge"]),  # Dict recursive merge
-        (list, ["override"]),  # List replace entirely
-    ],
-    ["override"],  # Other types (scalars) replace
-    ["override"],  # Type conflict: replace
-)
+    `copy.copy` keeps the container type, so tomlkit/ruamel formatting and
+    comments of untouched entries survive.
+    """
+    result = copy.copy(base)
+    for key, value in patch.items():
+        current = result.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            result[key] = _merge_copy(current, value)
+        elif key in result and _wants_multiline(result, value):
+            result[key] = _toml_multiline_array(value)
+        else:
+            result[key] = value
+    return result
 
 
-def merge_deep(*docs) -> dict:
+def merge_deep(*docs, inplace: bool = False) -> dict:
     """Deep merge multiple documents.
 
     Strategy:
     - Dicts: recursive merge
     - Lists: replace entirely
     - Scalars: replace
+
+    By default inputs are left untouched and unchanged subtrees are shared
+    with the result. Pass `inplace=True` to merge into `docs[0]` directly
+    when the caller discards it (no container copies at all).
     """
-    if not docs:
+    merge = _merge if inplace else _merge_copy
+    n = len(docs)
+    if n == 2:
+        # Common case: no slice, no loop
+        return merge(docs[0], docs[1])
+    if n == 0:
         return {}
 
     result = docs[0]
-    for doc in docs[1:]:
-        result = conserve_merger.merge(result, doc)
+    for i in range(1, n):
+        result = merge(result, docs[i])
     return result
 
 
@@ -92,6 +163,29 @@ class ConfigHandle(BaseHandle):
         self._ensure_loaded()
         return self.document.unwrap() if hasattr(self.document, "unwrap") else dict(self.document)
 
+    def _lookup_document(self):
+        """Return the document for read-only lookups (hook for cheaper views)."""
+        return self.document
+
+    def get(self, path: str, default=None):
+        """Return the value at a dot-separated path like "server.port", or default.
+
+        Walks the document directly instead of unwrapping all of it. Container
+        values are returned as independent plain copies.
+        """
+        self._ensure_loaded()
+        obj = self._lookup_document()
+        try:
+            for part in _split_path(path):
+                obj = obj[part]
+        except (KeyError, TypeError):
+            return default
+        if hasattr(obj, "unwrap"):
+            return obj.unwrap()
+        if isinstance(obj, (dict, list)):
+            return copy.deepcopy(obj)
+        return obj
+
     def replace(self, doc: dict) -> Self:
         """Replace in-memory content with new document and return self."""
         self._replace_impl(doc)
@@ -102,15 +196,33 @@ class ConfigHandle(BaseHandle):
         """Default replace implementation. Can be overridden."""
         self.document = doc
 
+    def _mutable_document(self):
+        """Return the document for in-place edits (hook for copy-on-write handles)."""
+        return self.document
+
     def merge(self, patch: dict, strategy: str = "deep") -> Self:
-        """Merge patch into in-memory document and return self (idempotent)."""
+        """Merge patch into in-memory document and return self (idempotent).
+
+        "deep" merges in place into the handle's own document (no copies).
+        Prefer `load().merge(patch).save()` over `read()` + `merge_deep()` +
+        `replace()`, which unwraps and rebuilds the whole document.
+        """
         self._ensure_loaded()
+        if strategy in ("deep", "shallow") and (not patch or patch is self._lookup_document()):
+            # Identity merge: don't even take a private copy of a shared document
+            return self
         if strategy == "deep":
-            self.document = conserve_merger.merge(self.document, patch)
+            document = self._mutable_document()
+            if isinstance(document, dict) and not any(isinstance(v, (dict, list)) for v in patch.values()):
+                # Flat scalar patch: deep merge degenerates to a plain update
+                document.update(patch)
+            else:
+                self.document = _merge(document, patch)
         elif strategy == "shallow":
             # First level merge only
-            if isinstance(self.document, dict):
-                self.document.update(patch)
+            document = self._mutable_document()
+            if isinstance(document, dict):
+                document.update(patch)
             else:
                 self.document = patch
         elif strategy == "override":
@@ -119,15 +231,27 @@ class ConfigHandle(BaseHandle):
             raise ValueError(f"Unknown merge strategy: {strategy}")
         return self
 
-    def _delete_path(self, obj: dict, parts: list[str]) -> None:
-        """Delete a single path from object, silently succeed if not found."""
-        for part in parts[:-1]:
-            if not isinstance(obj, dict) or part not in obj:
-                return
-            obj = obj[part]
+    def diff_merge(self, patch: dict) -> Self:
+        """Deep-merge patch, touching only keys whose value actually changes.
 
-        if isinstance(obj, dict) and parts[-1] in obj:
-            del obj[parts[-1]]
+        Same semantics as `merge()` (dict recursive, list/scalar replace), but
+        equal values are left as-is so their formatting and comments survive.
+        """
+        self._ensure_loaded()
+        if _needs_merge(self._lookup_document(), patch):
+            _diff_merge_into(self._mutable_document(), patch)
+        return self
+
+    def _delete_path(self, obj: dict, parts: tuple[str, ...]) -> None:
+        """Delete a single path from object, silently succeed if not found."""
+        # EAFP: one lookup per level; non-mappings raise TypeError
+        last = len(parts) - 1
+        try:
+            for i in range(last):
+                obj = obj[parts[i]]
+            del obj[parts[last]]
+        except (KeyError, TypeError):
+            pass
 
     def delete(self, *paths: str) -> Self:
         """Delete specified paths from document (idempotent).
@@ -137,7 +261,7 @@ class ConfigHandle(BaseHandle):
         """
         self._ensure_loaded()
         for path in paths:
-            self._delete_path(self.document, path.split("."))
+            self._delete_path(self._mutable_document(), _split_path(path))
         return self
 
     def save(self, path: str | Path | None = None, *, stage: bool | None = None) -> None:
@@ -149,44 +273,276 @@ class ConfigHandle(BaseHandle):
         return self._dump()
 
 
+@dataclass(slots=True)
+class _ParsedTOML:
+    """Pristine parse results of one TOML file state, shared across handles."""
+
+    content: str
+    fast: dict | None = None
+    document: TOMLDocument | None = None
+
+
 class TOMLHandle(ConfigHandle):
-    """Handle for TOML documents with format preservation."""
+    """Handle for TOML documents with format preservation.
+
+    Parse results are shared through a process-wide cache keyed by file stat.
+    The tomlkit AST is built lazily and copied only when this handle mutates
+    it, so pure reads through `read()`/`read_fast()` never re-parse.
+
+    With `preserve_format=False` the document is a plain dict parsed by
+    stdlib `tomllib` (no tomlkit AST at all); saving re-renders the file
+    without its comments or layout.
+    """
+
+    def __init__(self, path: str | Path | File, *, preserve_format: bool = True):
+        self.preserve_format = preserve_format
+        self._parsed = _ParsedTOML("")
+        # Handle-owned (mutable) document; None means "use the shared pristine one"
+        self._document = None
+        # Content serialized by the running `save`
+        self._serialized = None
+        super().__init__(path)
+
+    @property
+    def document(self):
+        """Handle-owned document (copied from the shared parse on first access)."""
+        return self._mutable_document()
+
+    @document.setter
+    def document(self, value):
+        self._document = value
+
+    def _fast(self) -> dict:
+        if self._parsed.fast is None:
+            self._parsed.fast = tomllib.loads(self._parsed.content)
+        return self._parsed.fast
+
+    def _pristine(self):
+        """Shared, read-only parse result for the current mode."""
+        if not self.preserve_format:
+            return self._fast()
+        if self._parsed.document is None:
+            self._parsed.document = tomlkit.parse(self._parsed.content)
+        return self._parsed.document
+
+    def _mutable_document(self):
+        if self._document is None:
+            if self.preserve_format and self._parsed.document is None:
+                # Fresh parse is as cheap as copying an AST nobody has built yet
+                self._document = tomlkit.parse(self._parsed.content)
+            else:
+                self._document = copy.deepcopy(self._pristine())
+        return self._document
+
+    def read(self) -> dict:
+        """Return current in-memory document as an independent plain dict."""
+        self._ensure_loaded()
+        if self._document is None:
+            # Unmodified: copy the shared `tomllib` dict (several times cheaper than parse + unwrap)
+            return copy.deepcopy(self._fast())
+        document = self._document
+        return document.unwrap() if hasattr(document, "unwrap") else copy.deepcopy(document)
+
+    _cacheable = True
+
+    def _cache_entry(self) -> _ParsedTOML:
+        return self._parsed
+
+    def _restore_entry(self, entry: _ParsedTOML) -> None:
+        self._parsed = entry
+        self._document = None
 
     def _parse(self, content: str):
-        self.document = tomlkit.parse(content)
+        # Validate at load time: `tomllib` is far cheaper than tomlkit and its dict serves later reads
+        try:
+            fast = tomllib.loads(content)
+        except tomllib.TOMLDecodeError:
+            if self.preserve_format:
+                # Report tomlkit's ParseError, as an eager tomlkit parse would
+                tomlkit.parse(content)
+            raise
+        self._parsed = _ParsedTOML(content, fast=fast)
+        self._document = None
 
     def _dump(self) -> str:
-        return tomlkit.dumps(self.document)
+        if self._document is None:
+            # Unmodified: tomlkit round-trips byte-for-byte
+            return self._parsed.content
+        return tomlkit.dumps(self._document)
+
+    def _get_serialized_content(self) -> str:
+        # Kept for `save` to re-publish without dumping a second time
+        self._serialized = self._dump()
+        return self._serialized
+
+    def read_fast(self) -> dict:
+        """Return document as plain dict via `tomllib` (read-only fast path).
+
+        The returned dict is shared with other handles and MUST NOT be mutated.
+        Falls back to `read()` once this handle holds in-memory edits.
+        """
+        self._ensure_loaded()
+        if self._document is not None:
+            return self.read()
+        return self._fast()
+
+    def _lookup_document(self):
+        # Unmodified: `tomllib` dict instead of building the tomlkit AST
+        return self._fast() if self._document is None else self._document
 
     def _replace_impl(self, doc: dict):
-        self.document.clear()
-        self.document.update(doc)
+        if not self.preserve_format:
+            # Plain dict mode has no formatting to keep: hold the reference
+            self._document = doc
+            return
+        if not self._parsed.content or self._parsed.content.isspace():
+            # Nothing to preserve: skip parsing/copying the old AST
+            self._document = tomlkit.document()
+        document = self._mutable_document()
+        # Clearing in place keeps non-key trivia such as a header comment
+        document.clear()
+        document.update(doc)
+
+    def save(self, path: str | Path | None = None, *, stage: bool | None = None) -> None:
+        self._serialized = None
+        super().save(path, stage=stage)
+        staged = path is None if stage is None else stage
+        if not staged and (path is None or Path(path) == Path(self.path)):
+            # Re-publish the state just written; later edits copy again
+            key = self._cache_key()
+            if key:
+                # Only a real tomlkit AST may be shared as the pristine document
+                document = self._document if isinstance(self._document, TOMLDocument) else None
+                self._parsed = _ParsedTOML(self._serialized, document=document)
+                self._document = None
+                _cache_put(key, self._parsed)
+
+
+# Per-thread YAML instances: `rt` (round-trip) and `safe` (YAML objects are not thread-safe)
+_YAML_LOCAL = threading.local()
+
+
+def _new_yaml(preserve_format: bool) -> YAML:
+    if preserve_format:
+        yaml = YAML()
+        yaml.preserve_quotes = True
+    else:
+        yaml = YAML(typ="safe")
+        yaml.default_flow_style = False
+        yaml.sort_base_mapping_type_on_output = False
+    yaml.width = 4096  # Prevent line wrapping
+    return yaml
 
 
 class YAMLHandle(ConfigHandle):
-    """Handle for YAML documents with format preservation."""
+    """Handle for YAML documents with format preservation.
 
-    def __init__(self, path: str | Path | File):
+    Parsed documents are shared through the process-wide parse cache; the
+    handle deep-copies before its first in-place edit (copy-on-write).
+
+    With `preserve_format=False` ruamel.yaml runs in "safe" mode: plain
+    dicts/lists, the libyaml-based C parser when `ruamel.yaml.clib` is
+    installed, and no comments or quoting kept on save.
+    """
+
+    _cacheable = True
+
+    def __init__(self, path: str | Path | File, *, preserve_format: bool = True):
         super().__init__(path)
-        # Each instance has its own YAML configuration
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
-        self.yaml.width = 4096  # Prevent line wrapping
+        self.preserve_format = preserve_format
+        # Per-handle YAML override; None means the shared per-thread instance
+        self._yaml = None
+        # Shared cache entry; the document is shared while `_document is _pristine`
+        self._pristine = None
+
+    @property
+    def document(self):
+        """Handle-owned document (copied from the shared parse on first access)."""
+        return self._mutable_document()
+
+    @document.setter
+    def document(self, value):
+        self._document = value
+
+    @property
+    def yaml(self) -> YAML:
+        """YAML instance used to load/dump.
+
+        Configured instances are shared per thread and mode (building one
+        costs more than parsing a small file); assign a new `YAML()` to
+        customize a single handle instead of mutating the shared one. Such a
+        handle bypasses the shared parse cache.
+        """
+        if self._yaml is not None:
+            return self._yaml
+        name = "rt" if self.preserve_format else "safe"
+        yaml = getattr(_YAML_LOCAL, name, None)
+        if yaml is None:
+            yaml = _new_yaml(self.preserve_format)
+            setattr(_YAML_LOCAL, name, yaml)
+        return yaml
+
+    @yaml.setter
+    def yaml(self, value: YAML) -> None:
+        self._yaml = value
+
+    def _cache_key(self) -> tuple | None:
+        if self._yaml is not None:
+            # A custom loader may parse differently: never share its documents
+            return None
+        # Round-trip and safe parses of the same file are different documents
+        key = super()._cache_key()
+        return (*key, self.preserve_format) if key else None
 
     def _parse(self, content: str):
-        self.document = self.yaml.load(content) or {}
+        self._document = self.yaml.load(content) or {}
+
+    def _cache_entry(self):
+        self._pristine = self._document
+        return self._document
+
+    def _restore_entry(self, entry) -> None:
+        self._document = self._pristine = entry
+
+    def _mutable_document(self):
+        if self._document is self._pristine:
+            self._document = copy.deepcopy(self._pristine)
+        return self._document
+
+    def _lookup_document(self):
+        # Read-only walk: the shared parse needs no copy
+        return self._document
+
+    def read(self) -> dict:
+        """Return current in-memory document (a private copy while shared)."""
+        self._ensure_loaded()
+        if self._document is self._pristine:
+            return dict(copy.deepcopy(self._document))
+        return dict(self._document)
 
     def _dump(self) -> str:
         stream = StringIO()
-        self.yaml.dump(self.document, stream)
+        self.yaml.dump(self._document, stream)
         return stream.getvalue()
 
 
 class JSONHandle(ConfigHandle):
-    """Handle for JSON documents."""
+    """Handle for JSON documents.
+
+    Parsing goes through msgspec (C); stdlib `json` handles what msgspec
+    rejects (NaN/Infinity literals, exotic keys) and reports errors. Dumping
+    stays on stdlib `json`: msgspec spells floats differently (`1e100` vs
+    `1e+100`), which would rewrite existing files.
+    """
 
     def _parse(self, content: str):
-        self.document = json_lib.loads(content) if content.strip() else {}
+        if not content or content.isspace():
+            self.document = {}
+            return
+        try:
+            self.document = msgspec.json.decode(content)
+        except msgspec.DecodeError:
+            self.document = json_lib.loads(content)
 
     def _dump(self) -> str:
         return json_lib.dumps(self.document, indent=2, ensure_ascii=False) + "\n"
@@ -1,9 +1,41 @@
 """Core API for Conserve - BaseHandle only."""
 
+import os
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
 
 from .file import File
 
+# Process-wide LRU of parsed documents keyed by (handle type, path, st_mtime_ns, st_size)
+_PARSE_CACHE: OrderedDict[tuple, Any] = OrderedDict()
+_PARSE_CACHE_MAXSIZE = 128
+
+
+def _stat_key(file: File) -> tuple[str, int, int] | None:
+    """Return (path, st_mtime_ns, st_size) for a local file, or None if uncacheable."""
+    if file.is_remote:
+        return None
+    try:
+        st = os.stat(file.path)
+    except OSError:
+        return None
+    return (str(file.path), st.st_mtime_ns, st.st_size)
+
+
+def _cache_put(key: tuple, entry: Any) -> None:
+    _PARSE_CACHE[key] = entry
+    _PARSE_CACHE.move_to_end(key)
+    if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+        _PARSE_CACHE.popitem(last=False)
+
+
+def invalidate_parse_cache(path: str | Path) -> None:
+    """Drop cached parses of a path (its stat may not change within one mtime tick)."""
+    path = str(path)
+    for key in [key for key in _PARSE_CACHE if key[1] == path]:
+        del _PARSE_CACHE[key]
+
 
 class BaseHandle:
     """Base class for all Handles with simplified Plan integration."""
@@ -26,6 +58,23 @@ class BaseHandle:
         """Return serialized content."""
         return self._dump()
 
+    # --- Parse cache hooks (opt-in via `_cacheable`) ---
+    _cacheable = False
+
+    def _cache_key(self) -> tuple | None:
+        if not self._cacheable:
+            return None
+        stat = _stat_key(self.file)
+        return (type(self), *stat) if stat else None
+
+    def _cache_entry(self) -> Any:
+        """Return freshly parsed state for sharing; handle MUST copy before mutating it."""
+        raise NotImplementedError
+
+    def _restore_entry(self, entry: Any) -> None:
+        """Adopt a shared cache entry as current (read-only) state."""
+        raise NotImplementedError
+
     # --- Unified lifecycle helpers ---
     def _ensure_loaded(self) -> None:
         """Ensure underlying state is loaded exactly once."""
@@ -36,15 +85,25 @@ class BaseHandle:
         """Load from file if exists, otherwise parse empty content.
 
         Subclasses MUST implement `_parse`. This base method centralizes the
-        idempotent load behavior shared by all handles.
+        idempotent load behavior shared by all handles. Cacheable handles
+        reuse the parse of an unchanged file (same path, mtime and size).
         """
-        if self.file.exists():
+        key = self._cache_key()
+        if key is not None and (entry := _PARSE_CACHE.get(key)) is not None:
+            _PARSE_CACHE.move_to_end(key)
+            self._restore_entry(entry)
+            self._loaded = True
+            return self
+
+        try:
             content = self.file.read_text(encoding="utf-8")
-            self._parse(content)
-        else:
+        except FileNotFoundError:
             # Parse empty content to initialize default state
-            self._parse("")
+            content = ""
+        self._parse(content)
         self._loaded = True
+        if key is not None:
+            _cache_put(key, self._cache_entry())
         return self
 
     def save(self, path: str | Path | None = None, *, stage: bool | None = None) -> None:
@@ -69,7 +128,15 @@ class BaseHandle:
             plan.stage(target_path, self._get_serialized_content())
         else:
             target_file = File(str(target_path))
+            content = self._get_serialized_content()
+            # Skip no-op writes: keep mtime so downstream tools don't re-run
+            try:
+                if target_file.read_text(encoding="utf-8") == content:
+                    return
+            except FileNotFoundError:
+                pass
             # Only create parents for local paths
             if not target_file.is_remote:
                 target_file.path.parent.mkdir(parents=True, exist_ok=True)
-            target_file.write_text(self._get_serialized_content(), encoding="utf-8")
+            target_file.write_text(content, encoding="utf-8")
+            invalidate_parse_cache(target_file.path)
@@ -1,10 +1,42 @@
 """Auto-discovery mechanism (pytest-style)."""
 
+import hashlib
 import importlib.util
 import inspect
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import FunctionType, ModuleType
 from typing import Callable
 
+# Task function name prefixes (conf_* kept as alias)
+_TASK_PREFIXES = ("conserve_", "conf_")
+
+# Naming conventions for files in .conserve/ (conf_* kept as alias):
+# conserve_*.py, conf_*.py, *_conserve.py, *_conf.py; "_"-prefixed files are private
+_CONFIG_FILE = re.compile(r"(?!_)(?:(?:conserve_|conf_).*|.*(?:_conserve|_conf))\.py", re.DOTALL)
+
+# Loaded config modules keyed by path, validated against (st_ino, st_mtime_ns, st_size)
+_MODULE_CACHE: dict[Path, tuple[tuple[int, int, int], ModuleType]] = {}
+# Discovered task functions per loaded module (same lifetime as the module entry)
+_FUNCTIONS_CACHE: dict[Path, tuple[ModuleType, list[tuple[str, Callable]]]] = {}
+
+# Task manifest location (relative to root), only used with a .conserve/ directory
+MANIFEST_PATH = Path(".conserve") / ".cache" / "tasks.json"
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRef:
+    """Discovered task whose function is resolved lazily (see `resolve_tasks`)."""
+
+    task_id: str
+    path: Path
+    func_name: str
+    func: Callable | None = field(default=None, compare=False, repr=False)
+
 
 def discover_config_files(root_dir: Path | None = None) -> list[Path]:
     """Discover configuration files following naming conventions.
@@ -12,28 +44,103 @@ def discover_config_files(root_dir: Path | None = None) -> list[Path]:
     Search order:
     1. .conserve/ directory with conserve_*.py or *_conserve.py files
     2. Single .conserve.py file in root
-    3. Also support conf_*.py and *_conf.py as aliases
+    3. Also support conf_*.py and *_conf.py as aliases; an alias is skipped
+       when its conserve_*/ *_conserve counterpart exists (conserve preferred)
     """
     root_dir = Path(root_dir or Path.cwd())
 
     config_files = []
 
-    # Check for .conserve directory
+    # Check for .conserve directory (single scandir pass, no per-pattern glob)
     conserve_dir = root_dir / ".conserve"
-    if conserve_dir.is_dir():
-        patterns = ["conserve_*.py", "*_conserve.py", "conf_*.py", "*_conf.py"]
-        for pattern in patterns:
-            for file_path in conserve_dir.glob(pattern):
-                # Skip private files and avoid duplicates
-                if not file_path.name.startswith("_") and file_path not in config_files:
-                    config_files.append(file_path)
+    has_conserve_dir = conserve_dir.is_dir()
+    if has_conserve_dir:
+        with os.scandir(conserve_dir) as entries:
+            for entry in entries:
+                # One C-level match per name (also skips private files)
+                if _CONFIG_FILE.fullmatch(entry.name) and entry.is_file():
+                    config_files.append(conserve_dir / entry.name)
+        # Drop conf_* aliases shadowed by a conserve_* file (name set, no extra stat)
+        names = {path.name for path in config_files}
+        config_files = [path for path in config_files if _preferred_name(path.name) not in names]
 
     # Check for single .conserve.py file
     single_file = root_dir / ".conserve.py"
-    if single_file.exists() and not conserve_dir.is_dir():
+    if not has_conserve_dir and single_file.exists():
         config_files.append(single_file)
 
-    return sorted(config_files, key=lambda p: (p.parent.relative_to(root_dir), p.name))
+    # All candidates share one parent (.conserve/ or root), so the name is the sort key
+    return sorted(config_files, key=lambda p: p.name)
+
+
+def _preferred_name(name: str) -> str | None:
+    """Return the conserve_* spelling of a conf_* alias file name (None otherwise)."""
+    if name.startswith("conf_"):
+        return "conserve_" + name[5:]
+    if name.endswith("_conf.py"):
+        return name[:-8] + "_conserve.py"
+    return None
+
+
+def _load_module(module_path: Path) -> ModuleType | None:
+    """Import a config file once per process (re-imported if the file changes)."""
+    st = module_path.stat()
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _MODULE_CACHE.get(module_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    if not (spec and spec.loader):
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    # Register like a regular import (dataclasses, pickling and nested imports look
+    # here) without shadowing an unrelated module of the same name
+    previous = sys.modules.get(spec.name)
+    owned = previous is None or (cached is not None and previous is cached[1])
+    if owned:
+        sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        if owned:
+            sys.modules.pop(spec.name, None)
+        raise
+    _MODULE_CACHE[module_path] = (key, module)
+    return module
+
+
+def clear_discovery_cache() -> None:
+    """Forget loaded config modules and their discovered functions."""
+    _MODULE_CACHE.clear()
+    _FUNCTIONS_CACHE.clear()
+
+
+def _callable_without_args(func: Callable) -> bool:
+    """Return True if func has no required parameters.
+
+    Plain functions are checked from their code object; `inspect.signature`
+    (slow) is only used when it could disagree, i.e. for `__wrapped__` or
+    `__signature__` overrides.
+    """
+    if not (hasattr(func, "__wrapped__") or hasattr(func, "__signature__")):
+        code = func.__code__
+        if not (code.co_argcount or code.co_kwonlyargcount):
+            # Typical task: no named parameters at all
+            return True
+        if code.co_argcount > len(func.__defaults__ or ()):
+            return False
+        kwonly = code.co_varnames[code.co_argcount : code.co_argcount + code.co_kwonlyargcount]
+        kwdefaults = func.__kwdefaults__ or {}
+        return all(name in kwdefaults for name in kwonly)
+
+    sig = inspect.signature(func)
+    return not any(
+        p.default is inspect.Parameter.empty
+        and p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for p in sig.parameters.values()
+    )
 
 
 def discover_functions(module_path: Path) -> list[tuple[str, Callable]]:
@@ -45,54 +152,153 @@ def discover_functions(module_path: Path) -> list[tuple[str, Callable]]:
     - Start with 'conserve_' or 'conf_' (conserve preferred)
     - Not start with underscore (private)
     """
-    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
-    if not (spec and spec.loader):
+    module = _load_module(module_path)
+    if module is None:
         return []
-
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    cached = _FUNCTIONS_CACHE.get(module_path)
+    if cached is not None and cached[0] is module:
+        return list(cached[1])
 
     functions = []
-    for name, obj in inspect.getmembers(module, inspect.isfunction):
+    # One walk over the module namespace; the prefix test rejects most names cheaply
+    for name, obj in module.__dict__.items():
         # Skip private or non-matching names
-        if name.startswith("_") or not (name.startswith("conserve_") or name.startswith("conf_")):
+        if not name.startswith(_TASK_PREFIXES) or not isinstance(obj, FunctionType):
             continue
 
         # Check if callable without args
-        sig = inspect.signature(obj)
-        if any(
-            p.default is inspect.Parameter.empty
-            and p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-            for p in sig.parameters.values()
-        ):
+        if not _callable_without_args(obj):
             continue
 
         functions.append((name, obj))
 
-    return sorted(functions, key=lambda x: x[0])
+    functions.sort(key=lambda x: x[0])
+    _FUNCTIONS_CACHE[module_path] = (module, functions)
+    return list(functions)
 
 
-def discover_all_tasks(root_dir: Path | None = None) -> list[tuple[str, Callable]]:
-    """Discover all conserve tasks in the project.
+def _root_prefix(root_dir: Path) -> int:
+    """Length of the string prefix that `root_dir / name` puts before name.
 
-    Returns list of (task_id, function) tuples where task_id is "module:function".
+    Discovered files are built as `root_dir / ...`, so slicing this prefix off
+    gives their relative path (handles "." and "/" roots).
     """
-    root_dir = root_dir or Path.cwd()
-    tasks = []
+    return len(str(Path(root_dir) / "_")) - 1
+
+
+def _relpath(prefix: int, path: Path) -> str:
+    """POSIX path of a discovered file relative to root (string slicing, no Path math)."""
+    return str(path)[prefix:].replace(os.sep, "/")
 
-    for config_file in discover_config_files(root_dir):
+
+def _scan_tasks(root_dir: Path, config_files: list[Path]) -> list[TaskRef]:
+    """Import config files and collect tasks (functions pre-resolved)."""
+    refs = []
+    prefix = _root_prefix(root_dir)
+    for config_file in config_files:
         # Create module identifier
         if config_file.name == ".conserve.py":
             module_id = "conserve"
         else:
-            module_id = str(config_file.relative_to(root_dir).with_suffix("")).replace("/", ".")
+            module_id = _relpath(prefix, config_file).removesuffix(".py").replace("/", ".")
 
         for func_name, func in discover_functions(config_file):
-            tasks.append((f"{module_id}:{func_name}", func))
+            refs.append(TaskRef(f"{module_id}:{func_name}", config_file, func_name, func))
+    return refs
+
+
+def _manifest_key(root_dir: Path, config_files: list[Path]) -> str:
+    """Hash (name, mtime_ns, size) of every config file (and recorded helper module)."""
+    digest = hashlib.blake2b(digest_size=16)
+    prefix = _root_prefix(root_dir)
+    for config_file in config_files:
+        st = config_file.stat()
+        digest.update(f"{_relpath(prefix, config_file)}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
 
+def _project_modules(root_dir: Path, config_files: list[Path]) -> list[str]:
+    """Root-relative paths of loaded modules that live in the project (config files excluded).
+
+    Config files may import local helpers (which can define or re-export
+    tasks); they are part of the manifest key. Installed packages are skipped.
+    """
+    root = os.path.join(os.path.abspath(root_dir), "")
+    skip = {os.path.abspath(path) for path in config_files}
+    modules = set()
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if not file:
+            continue
+        file = os.path.abspath(file)
+        if file.startswith(root) and file not in skip and "site-packages" not in file:
+            modules.add(file[len(root) :].replace(os.sep, "/"))
+    return sorted(modules)
+
+
+def discover_all_tasks_cached(root_dir: Path | None = None) -> list[TaskRef]:
+    """Discover tasks via the `.conserve/.cache/tasks.json` manifest when fresh.
+
+    On a manifest hit no config module is imported; functions are resolved
+    later by `resolve_tasks` for the selected tasks only. On a miss (or for
+    single-file `.conserve.py` projects) a full scan runs and the manifest is
+    rewritten. The key covers the config files and the project modules loaded
+    when the scan finishes (their helpers); modules imported lazily inside
+    task bodies are not tracked, as they cannot change the task list.
+    """
+    root_dir = Path(root_dir or Path.cwd())
+    config_files = discover_config_files(root_dir)
+    if not (root_dir / ".conserve").is_dir():
+        return _scan_tasks(root_dir, config_files)
+
+    manifest = root_dir / MANIFEST_PATH
+    try:
+        cached = json.loads(manifest.read_text(encoding="utf-8"))
+        # A deleted helper fails its stat (OSError): rescan
+        modules = [root_dir / path for path in cached["modules"]]
+        if cached["key"] == _manifest_key(root_dir, [*config_files, *modules]):
+            return [TaskRef(task_id, root_dir / path, func_name) for task_id, path, func_name in cached["tasks"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    refs = _scan_tasks(root_dir, config_files)
+    try:
+        modules = _project_modules(root_dir, config_files)
+        key = _manifest_key(root_dir, [*config_files, *(root_dir / path for path in modules)])
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        prefix = _root_prefix(root_dir)
+        tasks = [[ref.task_id, _relpath(prefix, ref.path), ref.func_name] for ref in refs]
+        manifest.write_text(json.dumps({"key": key, "modules": modules, "tasks": tasks}), encoding="utf-8")
+    except OSError:
+        pass  # Manifest is an optimization only
+    return refs
+
+
+def resolve_tasks(refs: list[TaskRef]) -> list[tuple[str, Callable]]:
+    """Resolve task references to (task_id, function), importing each file once."""
+    modules: dict[Path, dict[str, Callable]] = {}
+    tasks = []
+    for ref in refs:
+        func = ref.func
+        if func is None:
+            if ref.path not in modules:
+                modules[ref.path] = dict(discover_functions(ref.path))
+            func = modules[ref.path].get(ref.func_name)
+            if func is None:
+                continue
+        tasks.append((ref.task_id, func))
     return tasks
 
 
+def discover_all_tasks(root_dir: Path | None = None) -> list[tuple[str, Callable]]:
+    """Discover all conserve tasks in the project.
+
+    Returns list of (task_id, function) tuples where task_id is "module:function".
+    """
+    root_dir = root_dir or Path.cwd()
+    return resolve_tasks(_scan_tasks(root_dir, discover_config_files(root_dir)))
+
+
 def run_task(task_func: Callable) -> None:
     """Execute a conserve task function."""
     task_func()
@@ -5,51 +5,107 @@ from __future__ import annotations
 import re
 import tempfile
 import unicodedata
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from platformdirs import user_cache_dir
-from upath import UPath
 
+if TYPE_CHECKING:
+    from upath import UPath
 
+_SYMBOLS = re.compile(r"[^\w\s-]")
+_SEPARATORS = re.compile(r"[-\s]+")
+
+
+@cache
+def _upath() -> type[UPath]:
+    """Import UPath on first use: it pulls in fsspec (most of `import conserve` time)."""
+    from upath import UPath
+
+    return UPath
+
+
+@lru_cache(maxsize=1024)
 def to_valid_filename(name: str) -> str:
     # keep ASCII, drop symbols, collapse spaces/dashes
     normalized = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
-    cleaned = re.sub(r"[^\w\s-]", "", normalized).strip()
-    return re.sub(r"[-\s]+", "_", cleaned).lower()
+    cleaned = _SYMBOLS.sub("", normalized).strip()
+    return _SEPARATORS.sub("_", cleaned).lower()
 
 
 class File:
     """Unified file wrapper over UPath supporting local/remote/cache."""
 
+    __slots__ = ("_is_remote", "_path")
+
     # Global cache directory (overridable via ENV)
     CACHE_DIR = Path(user_cache_dir("conserve", "conserve"))
 
     def __init__(self, path: str | Path | UPath | None = None):
+        # Computed on first `is_remote` access (the answer depends only on the path)
+        self._is_remote: bool | None = None
         if path is None:
-            # use NamedTemporaryFile to avoid os-level calls
-            with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                self.path = UPath(tmp.name)
-        elif isinstance(path, (str, Path, UPath)):
-            self.path = path if isinstance(path, UPath) else UPath(path)
+            # Temp file is created on first access of `path`, not here
+            self._path = None
+        elif isinstance(path, (str, Path, upath := _upath())):
+            self._path = path if isinstance(path, upath) else upath(path)
         else:
             raise TypeError(f"File expects a path or URL, got {type(path).__name__}")
 
+    @property
+    def path(self) -> UPath:
+        if self._path is None:
+            # use NamedTemporaryFile to avoid os-level calls
+            with tempfile.NamedTemporaryFile(delete=False) as tmp:
+                self._path = _upath()(tmp.name)
+        return self._path
+
+    @path.setter
+    def path(self, value: UPath) -> None:
+        self._path = value
+        self._is_remote = None
+
     @property
     def is_remote(self) -> bool:
-        protocol = getattr(self.path, "protocol", None) or "file"
-        return protocol not in ("", "file")
+        # Checked on every load/save/commit; the protocol lookup runs once per File
+        if self._is_remote is None:
+            protocol = getattr(self.path, "protocol", None) or "file"
+            self._is_remote = protocol not in ("", "file")
+        return self._is_remote
 
     def cache(self, ttl: int = 0) -> Self:
         # fast-path for local files
         if not self.is_remote:
             return self
         cached_url = f"filecache::{self.path}"
-        cached_path = UPath(cached_url, cache_storage=str(self.CACHE_DIR), expiry_time=ttl)
+        cached_path = _upath()(cached_url, cache_storage=str(self.CACHE_DIR), expiry_time=ttl)
         return File(cached_path)
 
-    # Delegate to self.path
+    # Hot accessors forwarded explicitly (skips the failed lookup before `__getattr__`)
+    def read_text(self, *args, **kwargs) -> str:
+        return self.path.read_text(*args, **kwargs)
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def write_text(self, *args, **kwargs) -> int:
+        return self.path.write_text(*args, **kwargs)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def stat(self):
+        return self.path.stat()
+
+    def open(self, *args, **kwargs):
+        return self.path.open(*args, **kwargs)
+
+    # Delegate the long tail to self.path
     def __getattr__(self, name):
+        if name in ("_path", "_is_remote", "path"):
+            # Not initialized (e.g. during copy/unpickling): don't recurse via `path`
+            raise AttributeError(name)
         return getattr(self.path, name)
 
     def __str__(self) -> str:
@@ -2,7 +2,9 @@
 
 from .conda import conda_to_pypi as conda_to_pypi
 from .conda import pypi_to_conda as pypi_to_conda
+from .conda import pypi_to_conda_many as pypi_to_conda_many
 from .package import Package as Package
+from .package import gather_info as gather_info
 from .types import PackageVersionInfo as PackageVersionInfo
 
-__all__ = ["Package", "PackageVersionInfo", "conda_to_pypi", "pypi_to_conda"]
+__all__ = ["Package", "PackageVersionInfo", "conda_to_pypi", "gather_info", "pypi_to_conda", "pypi_to_conda_many"]
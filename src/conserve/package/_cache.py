@@ -0,0 +1,114 @@
+"""On-disk TTL cache for provider responses (survives process restarts)."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from typing import TypeVar
+
+import msgspec
+
+from conserve.file import File
+
+F = TypeVar("F", bound=Callable)
+
+# One JSON file per (namespace, method, args) key
+CACHE_DIR = File.CACHE_DIR / "pkg"
+
+
+def _enabled() -> bool:
+    return os.environ.get("CONSERVE_NO_CACHE", "") in ("", "0")
+
+
+# Longest TTL of any decorated method: files older than that are expired whatever they hold
+_max_ttl = 0.0
+_swept = False
+
+
+def _sweep() -> None:
+    """Delete expired entries once per process (keys that are never read again)."""
+    global _swept
+    _swept = True
+    cutoff = time.time() - _max_ttl
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                with contextlib.suppress(OSError):
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def _entry_path(parts: tuple) -> Path:
+    digest = hashlib.blake2b(msgspec.json.encode(parts), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def disk_cache(ttl: float) -> Callable[[F], F]:
+    """Memoize a provider method on disk for `ttl` seconds.
+
+    The key is `(self._cache_namespace, method name, *arguments)`, with
+    keyword arguments bound to their parameters (so `f(a)` and `f(name=a)`
+    share an entry); values must be JSON-serializable. Exceptions are not
+    cached. Expired or unreadable entries are deleted when read, and the
+    first write of a process sweeps entries older than the longest TTL. Set
+    `CONSERVE_NO_CACHE=1` to bypass the cache entirely. Cache I/O errors
+    never fail the call.
+    """
+
+    global _max_ttl
+    _max_ttl = max(_max_ttl, ttl)
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not _enabled():
+                return func(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            parts = (self._cache_namespace, func.__name__, *bound.args[1:])
+            path = _entry_path((*parts, bound.kwargs) if bound.kwargs else parts)
+            try:
+                entry = msgspec.json.decode(path.read_bytes())
+                if entry["expires"] > time.time():
+                    return entry["value"]
+                path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            except (OSError, msgspec.DecodeError, KeyError, TypeError):
+                # Corrupt entry: drop it (the fresh value below replaces it anyway)
+                with contextlib.suppress(OSError):
+                    path.unlink(missing_ok=True)
+
+            value = func(self, *args, **kwargs)
+            if not _swept:
+                # Before writing, so the fresh entry is never a sweep candidate
+                _sweep()
+            # Cache is an optimization only: any failure just skips the write
+            try:
+                data = msgspec.json.encode({"expires": time.time() + ttl, "value": value})
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            except (OSError, TypeError, msgspec.EncodeError):
+                return value
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError:
+                Path(tmp).unlink(missing_ok=True)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -2,17 +2,118 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import marshal
+import os
+import re
+import tempfile
+import urllib.error
+import urllib.request
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import ClassVar
+
+import msgspec
 
 from conserve.file import File
 
+_PEP503_SEPARATORS = re.compile(r"[-_.]+")
 
+# Bodies + HTTP validators for conditional GETs
+_REVALIDATE_DIR = File.CACHE_DIR / "revalidate"
+# Prebuilt reverse (PyPI -> conda) maps, one per mapping content digest
+_REVERSE_DIR = File.CACHE_DIR / "conda-reverse"
+
+
+@lru_cache(maxsize=4096)
 def normalize_pypi_name(name: str) -> str:
     """Normalize PyPI package name per PEP 503 (lowercase, [._-] → -)."""
-    normalized = name.lower().replace(".", "-").replace("_", "-")
-    while "--" in normalized:
-        normalized = normalized.replace("--", "-")
-    return normalized
+    # One C-level pass; the same names recur across dependency lists
+    return _PEP503_SEPARATORS.sub("-", name.lower())
+
+
+def _fetch_revalidated(url: str) -> bytes:
+    """GET `url`, reusing the local copy when the server answers 304 Not Modified.
+
+    The body is stored under `File.CACHE_DIR` with its ETag / Last-Modified
+    validators, so an unchanged upstream costs one round-trip, not a download.
+    """
+    stem = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    body_path = _REVALIDATE_DIR / f"{stem}.body"
+    meta_path = _REVALIDATE_DIR / f"{stem}.meta.json"
+
+    headers = {}
+    if body_path.exists():
+        try:
+            meta = msgspec.json.decode(meta_path.read_bytes())
+        except (OSError, msgspec.DecodeError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=60) as response:
+            data = response.read()
+            meta = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and headers:
+            try:
+                return body_path.read_bytes()
+            except OSError:
+                # Local copy vanished meanwhile: refetch unconditionally
+                body_path.unlink(missing_ok=True)
+                return _fetch_revalidated(url)
+        raise
+
+    if meta["etag"] or meta["last_modified"]:
+        # Local copy is an optimization only: failures just mean a full download next time.
+        # Validators go last (and stale ones first): a crash never pairs them with the wrong body.
+        try:
+            _REVALIDATE_DIR.mkdir(parents=True, exist_ok=True)
+            meta_path.unlink(missing_ok=True)
+            _replace_bytes(body_path, data)
+            _replace_bytes(meta_path, msgspec.json.encode(meta))
+        except OSError:
+            pass
+    return data
+
+
+def _replace_bytes(path: Path, content: bytes) -> None:
+    """Write via a sibling temp file + os.replace: readers see the old or the new file, never a torn one."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _remove_sidecars(prefix: str, keep: Path | None = None) -> None:
+    """Delete the reverse maps of one mapping source (all but `keep`), best effort."""
+    try:
+        for stale in _REVERSE_DIR.glob(f"{prefix}-*.marshal"):
+            if stale != keep:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _write_reverse_sidecar(path: Path, prefix: str, reverse: dict[str, str]) -> None:
+    """Persist a reverse map, replacing older maps of the same source only (best effort).
+
+    Other sources (another URL or ttl) keep their own files, so mappers that
+    hold different mapping contents never evict each other.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _replace_bytes(path, marshal.dumps(reverse))
+    except OSError:
+        return
+    _remove_sidecars(prefix, keep=path)
 
 
 class _CondaMapping:
@@ -20,57 +121,89 @@ class _CondaMapping:
 
     MAPPING_URL = "https://raw.githubusercontent.com/prefix-dev/parselmouth/main/files/mapping_as_grayskull.json"
 
+    # Parsed mappings shared by all instances, keyed by (url, ttl)
+    _MAPPING_CACHE: ClassVar[dict[tuple[str, int | None], dict[str, str]]] = {}
+    _REVERSE_CACHE: ClassVar[dict[tuple[str, int | None], dict[str, str]]] = {}
+    # Digest of the raw mapping bytes: names the on-disk reverse map
+    _DIGEST_CACHE: ClassVar[dict[tuple[str, int | None], str]] = {}
+
     def __init__(self, ttl: int | None = None):
         self._file = File(self.MAPPING_URL)
         self._ttl = ttl
+        self._key = (self.MAPPING_URL, ttl)
+        # Scopes this source's on-disk reverse maps
+        self._sidecar_prefix = hashlib.blake2b(repr(self._key).encode(), digest_size=8).hexdigest()
         self._mapping_data: dict[str, str] | None = None
         self._reverse_mapping: dict[str, str] | None = None
 
     def _ensure_loaded(self) -> None:
         if self._mapping_data is None:
-            cached = self._file.cache(ttl=self._ttl) if self._ttl else self._file
-            text = cached.read_text()
-            self._mapping_data = json.loads(text)
+            data = self._MAPPING_CACHE.get(self._key)
+            if data is None:
+                if self._ttl:
+                    raw = self._file.cache(ttl=self._ttl).read_bytes()
+                elif self._file.is_remote:
+                    # Always fresh, but skip the download when upstream is unchanged
+                    raw = _fetch_revalidated(self.MAPPING_URL)
+                else:
+                    raw = self._file.read_bytes()
+                # Decode bytes directly (no str round trip); msgspec is C-accelerated
+                data = self._MAPPING_CACHE[self._key] = msgspec.json.decode(raw)
+                self._DIGEST_CACHE[self._key] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            self._mapping_data = data
 
     def _build_reverse_mapping(self) -> dict[str, str]:
         if self._reverse_mapping is None:
-            self._ensure_loaded()
-            self._reverse_mapping = {}
-            assert self._mapping_data is not None
-            for conda, pypi in self._mapping_data.items():
-                if pypi not in self._reverse_mapping:
-                    self._reverse_mapping[pypi] = conda
+            reverse = self._REVERSE_CACHE.get(self._key)
+            if reverse is None:
+                self._ensure_loaded()
+                assert self._mapping_data is not None
+                digest = self._DIGEST_CACHE[self._key]
+                sidecar = _REVERSE_DIR / f"{self._sidecar_prefix}-{digest}.v{marshal.version}.marshal"
+                try:
+                    # Loading the prebuilt map is ~4x faster than normalizing every key again
+                    reverse = marshal.loads(sidecar.read_bytes())
+                except (OSError, EOFError, ValueError, TypeError):
+                    reverse = self._reverse_from(self._mapping_data)
+                    _write_reverse_sidecar(sidecar, self._sidecar_prefix, reverse)
+                self._REVERSE_CACHE[self._key] = reverse
+            self._reverse_mapping = reverse
         return self._reverse_mapping
 
+    def clear_cache(self) -> None:
+        """Forget the parsed mappings of this source and delete its on-disk reverse maps."""
+        self._mapping_data = self._reverse_mapping = None
+        for shared in (self._MAPPING_CACHE, self._REVERSE_CACHE, self._DIGEST_CACHE):
+            shared.pop(self._key, None)
+        _remove_sidecars(self._sidecar_prefix)
+
+    @staticmethod
+    def _reverse_from(data: dict[str, str]) -> dict[str, str]:
+        # Keys are PEP 503 normalized so a query is one dict hit. Built back to
+        # front so the first conda name per PyPI name wins. Uncached normalize:
+        # one-off keys would only evict the query-side lru_cache.
+        normalize = normalize_pypi_name.__wrapped__
+        return {normalize(pypi): conda for conda, pypi in reversed(data.items())}
+
     def conda_to_pypi(self, conda_name: str) -> str | None:
         self._ensure_loaded()
         assert self._mapping_data is not None
         return self._mapping_data.get(conda_name)
 
     def pypi_to_conda(self, pypi_name: str) -> str | None:
-        """Try PEP 503 normalized name first, fallback to original."""
-        reverse = self._build_reverse_mapping()
-
-        # Try with normalized name first (PEP 503)
-        normalized = normalize_pypi_name(pypi_name)
-        result = reverse.get(normalized)
+        """Look up by PEP 503 normalized name (matches any spelling of the name)."""
+        return self._build_reverse_mapping().get(normalize_pypi_name(pypi_name))
 
-        # Fallback to original name if not found
-        if result is None:
-            result = reverse.get(pypi_name)
-
-        return result
-
-
-# Module-level singleton
-_default_mapper: _CondaMapping | None = None
+    def pypi_to_conda_many(self, pypi_names: list[str]) -> list[str | None]:
+        """Batch variant of `pypi_to_conda`; output is aligned with input."""
+        reverse = self._build_reverse_mapping()
+        return [reverse.get(normalize_pypi_name(name)) for name in pypi_names]
 
 
+@cache
 def _get_mapper() -> _CondaMapping:
-    global _default_mapper
-    if _default_mapper is None:
-        _default_mapper = _CondaMapping()
-    return _default_mapper
+    """Module-level singleton, created on first use."""
+    return _CondaMapping()
 
 
 def conda_to_pypi(conda_name: str) -> str | None:
@@ -81,3 +214,8 @@ def conda_to_pypi(conda_name: str) -> str | None:
 def pypi_to_conda(pypi_name: str) -> str | None:
     """Convert PyPI package name to Conda name (PEP 503 normalized)."""
     return _get_mapper().pypi_to_conda(pypi_name)
+
+
+def pypi_to_conda_many(pypi_names: list[str]) -> list[str | None]:
+    """Convert many PyPI names to Conda names in one pass (aligned with input)."""
+    return _get_mapper().pypi_to_conda_many(pypi_names)
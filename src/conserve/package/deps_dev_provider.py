@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from typing import TYPE_CHECKING
+
 import grpc
 
 from conserve._generated.deps_dev.v3 import (
@@ -20,8 +23,25 @@ from conserve._generated.deps_dev.v3 import (
     VersionKey,
 )
 
+from ._cache import disk_cache
+from .provider import ttl_cache
 from .types import PackageVersionInfo
 
+if TYPE_CHECKING:
+    from packageurl import PackageURL
+
+
+# PURL type -> deps.dev System (built once, not per lookup)
+_PURL_TO_SYSTEM: dict[str, System] = {
+    "pypi": System.PYPI,
+    "npm": System.NPM,
+    "maven": System.MAVEN,
+    "cargo": System.CARGO,
+    "golang": System.GO,
+    "rubygems": System.RUBYGEMS,
+    "nuget": System.NUGET,
+}
+
 
 class DepsDevClient:
     """Client for deps.dev gRPC API (singleton)."""
@@ -29,30 +49,26 @@ class DepsDevClient:
     _instance: DepsDevClient | None = None
     _channel: grpc.Channel | None = None
     _stub: InsightsStub | None = None
+    _lock = threading.Lock()
 
     def __new__(cls) -> DepsDevClient:
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            # Initialize channel and stub (executed only once)
-            credentials = grpc.ssl_channel_credentials()
-            cls._channel = grpc.secure_channel("api.deps.dev:443", credentials)
-            cls._stub = InsightsStub(cls._channel)
+            with cls._lock:
+                if cls._instance is None:
+                    # Channel and stub exist before the instance is published:
+                    # concurrent callers (gather_info) never see a half-built client
+                    credentials = grpc.ssl_channel_credentials()
+                    cls._channel = grpc.secure_channel("api.deps.dev:443", credentials)
+                    cls._stub = InsightsStub(cls._channel)
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     @staticmethod
     def purl_type_to_system(purl_type: str) -> System | None:
         """Convert PURL type to deps.dev System enum."""
-        mapping = {
-            "pypi": System.PYPI,
-            "npm": System.NPM,
-            "maven": System.MAVEN,
-            "cargo": System.CARGO,
-            "golang": System.GO,
-            "rubygems": System.RUBYGEMS,
-            "nuget": System.NUGET,
-        }
-        return mapping.get(purl_type.lower())
+        return _PURL_TO_SYSTEM.get(purl_type.lower())
 
+    @ttl_cache()
     def get_package(self, system: System, name: str) -> Package | None:
         """Get package information including available versions.
 
@@ -65,6 +81,28 @@ class DepsDevClient:
         except grpc.RpcError:
             return None
 
+    def get_packages(self, system: System, names: list[str]) -> list[Package | None]:
+        """Batch variant of `get_package`; output is aligned with input.
+
+        All requests are in flight at once (futures multiplexed over the
+        single HTTP/2 channel), so N lookups cost ~1 round-trip, not N.
+        """
+        # The generated stub invokes its callable directly; build one that exposes `.future`
+        call = self._channel.unary_unary(
+            "/deps_dev.v3.Insights/GetPackage",
+            GetPackageRequest.SerializeToString,
+            Package.FromString,
+        )
+        futures = [call.future(GetPackageRequest(package_key=PackageKey(system=system, name=name))) for name in names]
+        packages: list[Package | None] = []
+        for future in futures:
+            try:
+                packages.append(future.result())
+            except grpc.RpcError:
+                packages.append(None)
+        return packages
+
+    @ttl_cache()
     def get_version(self, system: System, name: str, version: str) -> Version | None:
         """Get specific version information.
 
@@ -77,6 +115,7 @@ class DepsDevClient:
         except grpc.RpcError:
             return None
 
+    @ttl_cache()
     def get_project(self, project_id: str) -> Project | None:
         """Get project information (for GitHub/GitLab/Bitbucket).
 
@@ -92,6 +131,7 @@ class DepsDevClient:
         except grpc.RpcError:
             return None
 
+    @ttl_cache()
     def get_project_package_versions(self, project_id: str) -> ProjectPackageVersions | None:
         """Get package versions associated with a project.
 
@@ -115,6 +155,19 @@ class DepsDevClient:
             self._stub = None
 
 
+def _latest_version(package_info: Package) -> str | None:
+    """Return the default version of a package, else its first version."""
+    # Find default version
+    for version in package_info.versions:
+        if version.is_default and version.version_key:
+            return version.version_key.version
+
+    # Fallback to first version if no default
+    if package_info.versions and package_info.versions[0].version_key:
+        return package_info.versions[0].version_key.version
+    return None
+
+
 class DepsDevProvider:
     """Provider for package metadata from deps.dev API."""
 
@@ -132,7 +185,9 @@ class DepsDevProvider:
 
         if self._system is None:
             raise ValueError(f"Unsupported package type: {purl_type}")
+        self._cache_namespace = f"deps.dev/{purl_type.lower()}"
 
+    @disk_cache(ttl=300)
     def get_latest_version(self, name: str) -> str | None:
         """Get latest version from deps.dev registry.
 
@@ -149,17 +204,21 @@ class DepsDevProvider:
         if not package_info:
             raise ValueError(f"Package not found: {name}")
 
-        # Find default version
-        for version in package_info.versions:
-            if version.is_default and version.version_key:
-                return version.version_key.version
+        latest = _latest_version(package_info)
+        if latest is None:
+            raise ValueError(f"No versions available for: {name}")
+        return latest
 
-        # Fallback to first version if no default
-        if package_info.versions and package_info.versions[0].version_key:
-            return package_info.versions[0].version_key.version
+    def get_latest_versions(self, names: list[str]) -> list[str | None]:
+        """Batch variant of `get_latest_version` (concurrent RPCs).
 
-        raise ValueError(f"No versions available for: {name}")
+        Output is aligned with input; unknown packages or packages without
+        versions yield None instead of raising.
+        """
+        packages = self._client.get_packages(self._system, names)
+        return [_latest_version(package) if package else None for package in packages]
 
+    @disk_cache(ttl=3600)
     def get_version_info(self, name: str, version: str) -> PackageVersionInfo:
         """Get specific version metadata.
 
@@ -185,3 +244,7 @@ class DepsDevProvider:
             "links": [{"label": link.label, "url": link.url} for link in version_info.links],
             "registries": list(version_info.registries),
         }
+
+    def full_name(self, purl: PackageURL) -> str:
+        """Package name as deps.dev expects it."""
+        return purl.name
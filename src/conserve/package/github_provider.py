@@ -2,69 +2,86 @@
 
 from __future__ import annotations
 
+import threading
+from typing import TYPE_CHECKING
+
 from githubkit import GitHub
 from githubkit.exception import RequestFailed
 
+from ._cache import disk_cache
+from .provider import ttl_cache
 from .types import PackageVersionInfo
 
+if TYPE_CHECKING:
+    from githubkit.versions.latest.models import FullRepository, Release
+    from packageurl import PackageURL
+
 
 class GitHubClient:
     """Client for GitHub API (singleton)."""
 
     _instance: GitHubClient | None = None
     _github: GitHub | None = None
+    _lock = threading.Lock()
 
     def __new__(cls) -> GitHubClient:
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._github = GitHub()
+            with cls._lock:
+                if cls._instance is None:
+                    # Publish the instance only once it is fully built (thread-safe singleton)
+                    cls._github = GitHub()
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
-    def get_latest_release(self, owner: str, repo: str) -> dict | None:
+    @ttl_cache()
+    def get_latest_release(self, owner: str, repo: str) -> Release | None:
         """Get latest release information.
 
         Returns:
-            Release object or None if not found
+            Release model (parsed, not dumped; read attributes) or None if not found
         """
         try:
             response = self._github.rest.repos.get_latest_release(owner=owner, repo=repo)
-            return response.parsed_data.model_dump()
+            return response.parsed_data
         except RequestFailed:
             return None
 
-    def list_releases(self, owner: str, repo: str) -> list[dict] | None:
+    @ttl_cache()
+    def list_releases(self, owner: str, repo: str) -> list[Release] | None:
         """List all releases.
 
         Returns:
-            List of release objects or None on error
+            List of release models or None on error
         """
         try:
             response = self._github.rest.repos.list_releases(owner=owner, repo=repo, per_page=100)
-            return [r.model_dump() for r in response.parsed_data]
+            return list(response.parsed_data)
         except RequestFailed:
             return None
 
-    def get_release_by_tag(self, owner: str, repo: str, tag: str) -> dict | None:
+    @ttl_cache()
+    def get_release_by_tag(self, owner: str, repo: str, tag: str) -> Release | None:
         """Get release by tag name.
 
         Returns:
-            Release object or None if not found
+            Release model or None if not found
         """
         try:
             response = self._github.rest.repos.get_release_by_tag(owner=owner, repo=repo, tag=tag)
-            return response.parsed_data.model_dump()
+            return response.parsed_data
         except RequestFailed:
             return None
 
-    def get_repository(self, owner: str, repo: str) -> dict | None:
+    @ttl_cache()
+    def get_repository(self, owner: str, repo: str) -> FullRepository | None:
         """Get repository information.
 
         Returns:
-            Repository object or None if not found
+            Repository model or None if not found
         """
         try:
             response = self._github.rest.repos.get(owner=owner, repo=repo)
-            return response.parsed_data.model_dump()
+            return response.parsed_data
         except RequestFailed:
             return None
 
@@ -72,10 +89,13 @@ class GitHubClient:
 class GitHubProvider:
     """Provider for package metadata from GitHub releases."""
 
+    _cache_namespace = "github"
+
     def __init__(self):
         """Initialize GitHub provider."""
         self._client = GitHubClient()
 
+    @disk_cache(ttl=300)
     def get_latest_version(self, name: str) -> str | None:
         """Get latest release version from GitHub.
 
@@ -94,8 +114,9 @@ class GitHubProvider:
         if not release:
             raise ValueError(f"No releases found for: {name}")
 
-        return release.get("tag_name")
+        return release.tag_name
 
+    @disk_cache(ttl=3600)
     def get_version_info(self, name: str, version: str) -> PackageVersionInfo:
         """Get release metadata.
 
@@ -115,19 +136,21 @@ class GitHubProvider:
         if not release:
             raise ValueError(f"Release not found: {name}@{version}")
 
+        # Read only the fields we return (no full model_dump of body/assets/uploader)
         return {
-            "version": release.get("tag_name", version),
-            "published_at": release.get("published_at"),
-            "tag_name": release.get("tag_name"),
-            "name": release.get("name"),
-            "body": release.get("body"),
-            "prerelease": release.get("prerelease"),
-            "assets": [
-                {"name": asset.get("name"), "download_url": asset.get("browser_download_url")}
-                for asset in release.get("assets", [])
-            ],
+            "version": release.tag_name or version,
+            "published_at": release.published_at.isoformat() if release.published_at else None,
+            "tag_name": release.tag_name,
+            "name": release.name,
+            "body": release.body,
+            "prerelease": release.prerelease,
+            "assets": [{"name": asset.name, "download_url": asset.browser_download_url} for asset in release.assets],
         }
 
+    def full_name(self, purl: PackageURL) -> str:
+        """Repository name in 'owner/repo' format."""
+        return f"{purl.namespace}/{purl.name}" if purl.namespace else purl.name
+
     def _parse_name(self, name: str) -> tuple[str, str]:
         """Parse 'owner/repo' format.
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Self
 
 from packageurl import PackageURL
 
+from .conda import conda_to_pypi, pypi_to_conda
 from .provider import PackageProvider, get_provider
 from .types import PackageVersionInfo
 
@@ -30,18 +33,45 @@ def _normalize_input(s: str) -> str:
     return f"pkg:{s}"
 
 
+@lru_cache(maxsize=1024)
+def _parse_purl(purl: str) -> PackageURL:
+    """Parse a PURL once per distinct string (PackageURL is an immutable namedtuple)."""
+    return PackageURL.from_string(_normalize_input(purl))
+
+
 class Package:
     """Package object encapsulating PURL query interface."""
 
+    # Dependency walks create many instances: no per-instance __dict__
+    __slots__ = ("_provider", "_purl")
+
     def __init__(self, purl: str):
         """Initialize Package from string in short or full PURL forms."""
         try:
-            self._purl = PackageURL.from_string(_normalize_input(purl))
+            self._purl = _parse_purl(purl)
         except ValueError as e:
             raise ValueError(f"Invalid PURL format: {purl}") from e
 
         self._provider: PackageProvider | None = None
 
+    @classmethod
+    def of(cls, purl: str) -> Package:
+        """Return a shared Package for a PURL string (memoized constructor).
+
+        Packages are effectively immutable, so repeated lookups in dependency
+        walks can reuse one instance (and its resolved provider). Methods like
+        `latest()` still return new Package objects.
+        """
+        return _package_cached(purl)
+
+    @classmethod
+    def _from_purl(cls, purl: PackageURL, provider: PackageProvider | None = None) -> Self:
+        """Wrap an already parsed PackageURL, skipping string normalization/parsing."""
+        package = cls.__new__(cls)
+        package._purl = purl
+        package._provider = provider
+        return package
+
     @property
     def version(self) -> str | None:
         """Get version from PURL (None if not specified in PURL)."""
@@ -67,16 +97,6 @@ class Package:
 
         return self._provider
 
-    def _get_full_name(self) -> str:
-        """Get full package name including namespace if applicable.
-
-        Returns:
-            Full package name (e.g., 'owner/repo' for GitHub)
-        """
-        if self._purl.type == "github" and self._purl.namespace:
-            return f"{self._purl.namespace}/{self._purl.name}"
-        return self._purl.name
-
     def latest(self) -> Self:
         """Get Package object for latest version.
 
@@ -87,14 +107,10 @@ class Package:
             ValueError: If package not found or no versions available
         """
         provider = self._ensure_provider()
-        latest_version = provider.get_latest_version(self._get_full_name())
-
-        # Build new PURL with latest version
-        new_purl = self._purl.to_string().replace(f"@{self.version}", "") if self.version else self._purl.to_string()
-        if "@" not in new_purl:
-            new_purl = f"{new_purl}@{latest_version}"
+        latest_version = provider.get_latest_version(provider.full_name(self._purl))
 
-        return Package(new_purl)
+        # Swap the version field directly (no to_string/parse round-trip); same type, same provider
+        return self._from_purl(self._purl._replace(version=latest_version), provider)
 
     def info(self) -> PackageVersionInfo:
         """Get package version metadata.
@@ -127,7 +143,7 @@ class Package:
             ValueError: If package or version not found
         """
         provider = self._ensure_provider()
-        full_name = self._get_full_name()
+        full_name = provider.full_name(self._purl)
 
         if self.version:
             return provider.get_version_info(full_name, self.version)
@@ -145,8 +161,6 @@ class Package:
         if self._purl.type != "conda":
             raise ValueError(f"to_pypi() only available for conda packages, got: {self._purl.type}")
 
-        from .conda import conda_to_pypi
-
         mapped = conda_to_pypi(self._purl.name)
         if not mapped:
             raise ValueError(f"No PyPI mapping for conda package: {self._purl.name}")
@@ -161,9 +175,33 @@ class Package:
         if self._purl.type != "pypi":
             raise ValueError(f"to_conda() only available for pypi packages, got: {self._purl.type}")
 
-        from .conda import pypi_to_conda
-
         mapped = pypi_to_conda(self._purl.name)
         if not mapped:
             raise ValueError(f"No Conda mapping for PyPI package: {self._purl.name}")
         return Package(f"conda:{mapped}")
+
+
+@lru_cache(maxsize=4096)
+def _package_cached(purl: str) -> Package:
+    return Package(purl)
+
+
+def gather_info(packages: list[Package], *, max_workers: int = 16) -> list[PackageVersionInfo | ValueError]:
+    """Fetch `info()` for many packages concurrently (aligned with input).
+
+    Provider calls are blocking network I/O, so a thread pool overlaps the
+    round-trips: N lookups take ~max(RTT) instead of sum(RTT). Per-package
+    failures (ValueError: unsupported type, not found) are returned in place
+    instead of aborting the batch.
+    """
+
+    def fetch(pkg: Package) -> PackageVersionInfo | ValueError:
+        try:
+            return pkg.info()
+        except ValueError as e:
+            return e
+
+    if not packages:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(packages))) as executor:
+        return list(executor.map(fetch, packages))
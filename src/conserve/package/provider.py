@@ -2,10 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cache, wraps
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
 from .types import PackageVersionInfo
 
+if TYPE_CHECKING:
+    from packageurl import PackageURL
+
+F = TypeVar("F", bound=Callable)
+
+
+def ttl_cache(ttl: float = 300, maxsize: int = 512) -> Callable[[F], F]:
+    """Memoize a lookup method in-process for `ttl` seconds (LRU-bounded).
+
+    Meant for network-bound client methods: repeated lookups within a run
+    skip the round-trip. None results (not found / transient errors) are
+    not cached.
+    """
+
+    def decorator(func: F) -> F:
+        cache: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        # Guards cache bookkeeping only; the lookup itself runs unlocked (callers may be threads)
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+                if hit is not None and hit[0] > now:
+                    cache.move_to_end(args)
+                    return hit[1]
+            result = func(*args)
+            if result is not None:
+                with lock:
+                    cache[args] = (now + ttl, result)
+                    cache.move_to_end(args)
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
 
 class PackageProvider(Protocol):
     """Abstract interface for package metadata providers.
@@ -20,15 +66,40 @@ class PackageProvider(Protocol):
 
     def get_version_info(self, name: str, version: str) -> PackageVersionInfo: ...
 
+    def full_name(self, purl: PackageURL) -> str:
+        """Name this provider expects for a PURL (e.g. 'owner/repo' for GitHub)."""
+        ...
+
+
+def _deps_dev_provider(purl_type: str) -> PackageProvider:
+    from .deps_dev_provider import DepsDevProvider
+
+    return DepsDevProvider(purl_type)
 
-def get_provider(purl_type: str) -> PackageProvider:
-    if purl_type in ("pypi", "npm", "cargo", "maven", "rubygems", "nuget"):
-        from .deps_dev_provider import DepsDevProvider
 
-        return DepsDevProvider(purl_type)
-    elif purl_type == "github":
-        from .github_provider import GitHubProvider
+def _github_provider(purl_type: str) -> PackageProvider:
+    from .github_provider import GitHubProvider
 
-        return GitHubProvider()
-    else:
-        raise ValueError(f"Unsupported package type: {purl_type}")
+    return GitHubProvider()
+
+
+# PURL type -> provider factory (imports stay lazy: grpc / githubkit are heavy)
+_PROVIDERS: dict[str, Callable[[str], PackageProvider]] = {
+    "pypi": _deps_dev_provider,
+    "npm": _deps_dev_provider,
+    "cargo": _deps_dev_provider,
+    "maven": _deps_dev_provider,
+    "rubygems": _deps_dev_provider,
+    "nuget": _deps_dev_provider,
+    "github": _github_provider,
+}
+
+
+@cache
+def get_provider(purl_type: str) -> PackageProvider:
+    """Return the provider for a PURL type (memoized: providers are stateless)."""
+    try:
+        factory = _PROVIDERS[purl_type]
+    except KeyError:
+        raise ValueError(f"Unsupported package type: {purl_type}") from None
+    return factory(purl_type)
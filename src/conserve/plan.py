@@ -1,74 +1,187 @@
 """Plan module for change management."""
 
-from pathlib import Path
-from uuid import uuid4
 import difflib
+import os
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .core import invalidate_parse_cache
 from .file import File
 
 
+def _make_parents(paths: list[Path]) -> None:
+    """Create the parent directories of paths with one mkdir per unique directory.
+
+    Deepest directories go first; `parents=True` creates their ancestors,
+    which are then skipped.
+    """
+    made: set[Path] = set()
+    for parent in sorted({path.parent for path in paths}, key=lambda p: len(p.parts), reverse=True):
+        if parent in made:
+            continue
+        parent.mkdir(parents=True, exist_ok=True)
+        made.update((parent, *parent.parents))
+
+
+def _default_mode() -> int:
+    """Mode a plain `open(..., "w")` gives new files (0o666 minus the umask).
+
+    `os.umask` can only be read by setting it, which is process-global: call
+    this on one thread, never from the commit worker pool.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _atomic_write(path: Path, content: str, new_mode: int) -> None:
+    """Write via a sibling temp file + os.replace so readers never see torn files.
+
+    `path` must be resolved (symlinks followed) and its parent must exist.
+    Keeps the existing file mode; new files get `new_mode` (see
+    `_default_mode`). No fsync: durability is left to the OS, as with plain
+    writes.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = new_mode
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _read_original(real_path: Path) -> str | None:
+    """Current content of a staging target, None if it does not exist yet."""
+    try:
+        return File(str(real_path)).read_text()
+    except FileNotFoundError:
+        return None
+
+
 class Plan:
     """Simplified change plan manager - Handles provide path and content only."""
 
     def __init__(self):
-        # Real path -> memory file mapping
-        self._staging_map: dict[Path, File] = {}
+        # Real path -> staged content
+        self._staging_map: dict[Path, str] = {}
         # Record original content for diff
         self._original_contents: dict[Path, str | None] = {}
+        # Rendered per-file diffs, dropped when the path is re-staged
+        self._diff_cache: dict[Path, str] = {}
 
     def stage(self, real_path: Path, content: str) -> None:
         """Handle calls this method to stage content.
 
         - Handle only needs to provide: target path + serialized content
-        - Plan manages memory files and mapping relationships
+        - Plan keeps the content in memory until commit
         """
         # Record original content (on first staging)
         if real_path not in self._original_contents:
-            real_file = File(str(real_path))
-            self._original_contents[real_path] = real_file.read_text() if real_file.exists() else None
+            self._original_contents[real_path] = _read_original(real_path)
 
-        # Create memory file and stage content
-        memory_path = f"memory://staging/{uuid4()}/{real_path.name}"
-        memory_file = File(memory_path)
-        memory_file.write_text(content)
-        self._staging_map[real_path] = memory_file
+        self._staging_map[real_path] = content
+        self._diff_cache.pop(real_path, None)
+
+    def stage_many(self, items: Iterable[tuple[Path, str]]) -> None:
+        """Stage several (path, content) pairs at once.
+
+        Originals of newly staged paths are read concurrently instead of one
+        blocking read per `stage` call.
+        """
+        items = list(items)
+        missing = list(dict.fromkeys(path for path, _ in items if path not in self._original_contents))
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(missing))) as executor:
+                self._original_contents.update(zip(missing, executor.map(_read_original, missing), strict=True))
+        for real_path, content in items:
+            self.stage(real_path, content)
 
     def get_diff_summary(self) -> str:
         """Generate diff summary for all changes."""
         diffs = []
-        for real_path, memory_file in self._staging_map.items():
-            original = self._original_contents.get(real_path, "")
-            modified = memory_file.read_text()
-            if original != modified:
-                diff = difflib.unified_diff(
-                    (original or "").splitlines(keepends=True),
-                    modified.splitlines(keepends=True),
-                    fromfile=str(real_path),
-                    tofile=str(real_path),
-                )
-                diffs.append("".join(diff))
+        for real_path, modified in self._staging_map.items():
+            diff = self._diff_cache.get(real_path)
+            if diff is None:
+                original = self._original_contents.get(real_path, "")
+                # Plain string equality skips SequenceMatcher for unchanged files
+                diff = ""
+                if original != modified:
+                    diff = "".join(
+                        difflib.unified_diff(
+                            (original or "").splitlines(keepends=True),
+                            modified.splitlines(keepends=True),
+                            fromfile=str(real_path),
+                            tofile=str(real_path),
+                        )
+                    )
+                self._diff_cache[real_path] = diff
+            if diff:
+                diffs.append(diff)
         return "\n".join(diffs)
 
     def preview(self) -> dict[Path, str]:
         """Preview content to be written."""
-        return {real_path: memory_file.read_text() for real_path, memory_file in self._staging_map.items()}
+        return dict(self._staging_map)
 
     def commit(self) -> None:
         """Batch commit all staged changes."""
-        # Write directly, using File abstraction
-        for real_path, memory_file in self._staging_map.items():
-            File(str(real_path)).write_text(memory_file.read_text())
+        # Content is serialized at stage time; unchanged files are not touched
+        # Resolved target -> content; a later entry for the same target wins, as in order
+        local_writes: dict[Path, str] = {}
+        written: list[Path] = []
+        for real_path, content in self._staging_map.items():
+            if content == self._original_contents.get(real_path):
+                continue
+            real_file = File(str(real_path))
+            if real_file.is_remote:
+                real_file.write_text(content)
+                invalidate_parse_cache(real_file.path)
+            else:
+                local_writes[Path(os.path.realpath(real_file.path))] = content
+                written.append(real_file.path)
+
+        _make_parents(list(local_writes))
+        # Read the umask here, on the calling thread, once per batch
+        new_mode = _default_mode() if local_writes else 0
+        # Targets are distinct files: overlap their writes, then report the first failure
+        errors: list[BaseException] = []
+        if len(local_writes) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(local_writes))) as executor:
+                futures = [
+                    executor.submit(_atomic_write, path, content, new_mode) for path, content in local_writes.items()
+                ]
+            errors = [error for future in futures if (error := future.exception()) is not None]
+        else:
+            for path, content in local_writes.items():
+                _atomic_write(path, content, new_mode)
+        for path in written:
+            invalidate_parse_cache(path)
+        if errors:
+            raise errors[0]
         self._staging_map.clear()
         self._original_contents.clear()
+        self._diff_cache.clear()
 
     def rollback(self) -> None:
         """Clear staged changes."""
         self._staging_map.clear()
         self._original_contents.clear()
+        self._diff_cache.clear()
 
     def clear(self) -> None:
         """Clear all state (for task isolation)."""
         self._staging_map.clear()
         self._original_contents.clear()
+        self._diff_cache.clear()
 
 
 # Global singleton Plan instance
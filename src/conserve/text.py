@@ -7,32 +7,114 @@ from .core import BaseHandle
 from .file import File
 
 
+def _tracked(method_name: str):
+    """Wrap a `list` mutator so each call bumps the list's `version`."""
+    method = getattr(list, method_name)
+
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = method_name
+    return mutate
+
+
+class _Lines(list):
+    """List that counts its in-place modifications (lets TextHandle keep caches honest)."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+
+# Every in-place list mutator bumps `version`
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_Lines, _name, _tracked(_name))
+del _name
+
+
 class TextHandle(BaseHandle):
     """Text file line management."""
 
     def __init__(self, path: str | Path | File):
         super().__init__(path)
-        self.lines = []
+        self._lines = _Lines()
+        # Membership index for present() and memoized _dump(), each valid for one `_lines.version`
+        self._line_set: set[str] | None = None
+        self._indexed_version = -1
+        self._dumped: str | None = None
+        self._dumped_version = -1
         self._loaded = False
 
+    @property
+    def lines(self) -> list[str]:
+        """The file's lines, editable in place (also through a kept reference).
+
+        Every in-place change bumps the list's version, which invalidates the
+        membership index and memoized dump. Assigning a list stores a copy.
+        """
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: list[str]) -> None:
+        self._lines = _Lines(value)
+        self._line_set = None
+        self._dumped = None
+
+    def _index(self) -> set[str]:
+        lines = self._lines
+        if self._line_set is None or self._indexed_version != lines.version:
+            self._line_set = set(lines)
+            self._indexed_version = lines.version
+        return self._line_set
+
     def _parse(self, content: str):
         self.lines = content.splitlines(keepends=False) if content else []
 
     def _dump(self) -> str:
-        return "\n".join(self.lines) + ("\n" if self.lines else "")
+        lines = self._lines
+        if self._dumped is None or self._dumped_version != lines.version:
+            self._dumped = "\n".join(lines) + ("\n" if lines else "")
+            self._dumped_version = lines.version
+        return self._dumped
 
     # load/_ensure_loaded are inherited from BaseHandle
 
     def present(self, line: str) -> Self:
         self._ensure_loaded()
-        if line not in self.lines:
-            self.lines.append(line)
+        index = self._index()
+        if line not in index:
+            self._lines.append(line)
+            index.add(line)
+            self._indexed_version = self._lines.version
         return self
 
     def absent(self, line: str) -> Self:
         self._ensure_loaded()
-        while line in self.lines:
-            self.lines.remove(line)
+        # One linear pass; slice assignment keeps the list object for outside references
+        kept = [existing for existing in self._lines if existing != line]
+        if len(kept) == len(self._lines):
+            return self
+        up_to_date = self._line_set is not None and self._indexed_version == self._lines.version
+        self._lines[:] = kept
+        if up_to_date:
+            self._line_set.discard(line)
+            self._indexed_version = self._lines.version
         return self
 
     def save(self, path: str | Path | None = None, *, stage: bool | None = None) -> None:
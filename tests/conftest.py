@@ -1,14 +1,19 @@
 """Pytest configuration and fixtures"""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
+
+from conserve.package import _cache
 
 
 @pytest.fixture
-def workspace():
-    """Create a temporary workspace directory"""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def workspace(tmp_path_factory):
+    """Create a temporary workspace directory (cleaned up by pytest's tmp retention)"""
+    return tmp_path_factory.mktemp("workspace")
+
+
+@pytest.fixture(autouse=True)
+def package_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep provider disk-cache entries out of the user's real cache directory"""
+    cache_dir = tmp_path_factory.mktemp("pkg-cache")
+    monkeypatch.setattr(_cache, "CACHE_DIR", cache_dir)
+    return cache_dir
@@ -1,11 +1,44 @@
 """End-to-end tests for Conserve."""
 
+import contextlib
+import io
 import json
 import subprocess
+import sys
+import tomllib
+from pathlib import Path
 
-import tomlkit
+import pytest
 from ruamel.yaml import YAML
 
+from conserve import cli, core, discovery
+
+# Assertions only read values back: one shared safe (C-accelerated) loader
+_YAML = YAML(typ="safe")
+
+
+def run_cli(project: Path, *args: str) -> subprocess.CompletedProcess:
+    """Run the conserve CLI in-process from `project`, isolated like a fresh interpreter.
+
+    Task modules imported from the project and process-wide caches are dropped
+    afterwards, so consecutive calls behave like separate `python -m conserve.cli` runs.
+    """
+    before = set(sys.modules)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.chdir(project), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            cli.main(list(args))
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        finally:
+            for name in set(sys.modules) - before:
+                if Path(getattr(sys.modules[name], "__file__", None) or "/").is_relative_to(project):
+                    del sys.modules[name]
+            discovery.clear_discovery_cache()
+            core._PARSE_CACHE.clear()
+    return subprocess.CompletedProcess(["conserve", *args], returncode, stdout.getvalue(), stderr.getvalue())
+
 
 def test_e2e_config_sync(tmp_path):
     """Test end-to-end configuration synchronization workflow."""
@@ -74,30 +107,32 @@ def conserve_update_ports():
 """)
 
     # Run conserve to sync configs
-    subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--yes"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    run_cli(project, "apply", "--yes")
 
     # Check runtime config was created with merged values
     runtime_config = project / "config.runtime.toml"
     assert runtime_config.exists()
 
-    runtime = tomlkit.loads(runtime_config.read_text())
+    runtime = tomllib.loads(runtime_config.read_text())
     assert runtime["server"]["host"] == "localhost"
     assert runtime["server"]["port"] == 3000  # From local override
     assert runtime["database"]["url"] == "postgres://localhost/devdb"  # From local
     assert runtime["database"]["pool_size"] == 10  # From base
 
     # Check that ports were updated
-    base_updated = tomlkit.loads(base_config.read_text())
+    base_updated = tomllib.loads(base_config.read_text())
     assert base_updated["server"]["port"] == 18080  # 8080 + 10000
 
-    local_updated = tomlkit.loads(local_config.read_text())
+    local_updated = tomllib.loads(local_config.read_text())
     assert local_updated["server"]["port"] == 13000  # 3000 + 10000
 
+    # Re-running a sync that produces identical content must not rewrite the file
+    sync_local = ["apply", "--tasks", "conserve_sync_local", "--yes"]
+    run_cli(project, *sync_local)
+    runtime_mtime = runtime_config.stat().st_mtime_ns
+    run_cli(project, *sync_local)
+    assert runtime_config.stat().st_mtime_ns == runtime_mtime
+
 
 def test_e2e_multi_format_workflow(tmp_path):
     """Test working with multiple config formats."""
@@ -156,12 +191,7 @@ def conserve_build_manifest():
 """)
 
     # Run conserve
-    subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--yes"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    run_cli(project, "apply", "--yes")
 
     # Verify manifest was created correctly
     yaml_manifest = project / "manifest.yaml"
@@ -171,8 +201,7 @@ def conserve_build_manifest():
     assert json_manifest.exists()
 
     # Check YAML content
-    yaml = YAML()
-    yaml_content = yaml.load(yaml_manifest.read_text())
+    yaml_content = _YAML.load(yaml_manifest)
 
     assert yaml_content["application"]["name"] == "MyApp"
     assert yaml_content["deployment"]["environment"] == "production"
@@ -211,9 +240,12 @@ def helper_function():
     pass
 """)
 
-    # Test list command
+    # Legacy conf_* alias of an existing conserve_* file is shadowed
+    (conserve_dir / "conf_tasks.py").write_text("def conserve_legacy_task():\n    pass\n")
+
+    # Test list command (through the real `python -m` entry point)
     result = subprocess.run(
-        ["python", "-m", "conserve.cli", "list"],
+        [sys.executable, "-m", "conserve.cli", "list"],
         cwd=project,
         capture_output=True,
         text=True,
@@ -222,25 +254,18 @@ def helper_function():
     assert "conserve_task_one" in result.stdout
     assert "conserve_task_two" in result.stdout
     assert "helper_function" not in result.stdout
+    assert "conserve_legacy_task" not in result.stdout
+    # Discovery results are cached in a task manifest
+    assert (conserve_dir / ".cache" / "tasks.json").exists()
 
     # Test apply specific task
-    result = subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--tasks", "conserve_task_one", "--yes"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(project, "apply", "--tasks", "conserve_task_one", "--yes")
     assert result.returncode == 0
     assert (project / "task1.txt").exists()
     assert not (project / "task2.txt").exists()
 
     # Test apply all tasks
-    result = subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--yes"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(project, "apply", "--yes")
     assert result.returncode == 0
     assert (project / "task2.txt").exists()
 
@@ -255,14 +280,10 @@ def conserve_dry_task():
     Path("task3.txt").write_text("Should not exist in dry run")
 """)
 
-    result = subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--dry-run"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(project, "apply", "--dry-run")
     assert result.returncode == 0
     assert "[DRY RUN]" in result.stdout or "No changes to apply" in result.stdout
+    assert "conserve_dry_task" in result.stdout  # New file invalidates the manifest
     assert not (project / "task3.txt").exists()
 
 
@@ -343,42 +364,385 @@ def conserve_update_versions():
 """)
 
     # Run sync
-    result = subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--tasks", "conserve_sync_common", "--yes"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(project, "apply", "--tasks", "conserve_sync_common", "--yes")
     assert result.returncode == 0
 
     # Verify common config was synced
-    yaml = YAML()
-
-    app1 = yaml.load(app1_yaml.read_text())
+    app1 = _YAML.load(app1_yaml)
     assert app1["common"]["app_name"] == "SharedApp"
     assert app1["common"]["version"] == "2.0.0"
     assert app1["service"]["name"] == "service-one"  # Original preserved
 
-    app2 = yaml.load(app2_yaml.read_text())
+    app2 = _YAML.load(app2_yaml)
     assert app2["common"]["app_name"] == "SharedApp"
     assert app2["common"]["version"] == "2.0.0"
     assert app2["service"]["name"] == "service-two"  # Original preserved
 
     # Run version update
-    result = subprocess.run(
-        ["python", "-m", "conserve.cli", "apply", "--tasks", "conserve_update_versions", "--yes"],
-        cwd=project,
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(project, "apply", "--tasks", "conserve_update_versions", "--yes")
     assert result.returncode == 0
 
     # Verify versions updated everywhere
-    base = tomlkit.loads(base_toml.read_text())
+    base = tomllib.loads(base_toml.read_text())
     assert base["common"]["version"] == "2.1.0"
 
-    app1 = yaml.load(app1_yaml.read_text())
+    app1 = _YAML.load(app1_yaml)
     assert app1["common"]["version"] == "2.1.0"
 
-    app2 = yaml.load(app2_yaml.read_text())
+    app2 = _YAML.load(app2_yaml)
     assert app2["common"]["version"] == "2.1.0"
+
+
+def test_e2e_diff_merge_preserves_unchanged(tmp_path):
+    """diff_merge only rewrites keys whose value changed."""
+
+    project = tmp_path / "diff_merge"
+    project.mkdir()
+
+    deps = project / "deps.toml"
+    deps.write_text("""[dependencies]
+tomlkit = "*"  # keep me
+extras = ["a", "b", "c"]
+tyro = ">=0.8"
+""")
+
+    conserve_script = project / ".conserve.py"
+    conserve_script.write_text("""
+import conserve
+
+def conserve_sync_deps():
+    conserve.TOMLHandle("deps.toml").load().diff_merge(
+        {"dependencies": {"tomlkit": "*", "extras": ["a", "b", "c"], "tyro": ">=0.9", "msgspec": "*"}}
+    ).save(stage=False)
+""")
+
+    result = run_cli(project, "apply", "--yes")
+    assert result.returncode == 0
+
+    content = deps.read_text()
+    # Unchanged entries keep their exact formatting
+    assert 'tomlkit = "*"  # keep me' in content
+    assert 'extras = ["a", "b", "c"]' in content
+
+    doc = tomllib.loads(content)
+    assert doc["dependencies"]["tyro"] == ">=0.9"
+    assert doc["dependencies"]["msgspec"] == "*"
+
+
+def test_e2e_staged_commit(tmp_path):
+    """Staged saves are committed atomically and keep file permissions."""
+
+    project = tmp_path / "staged"
+    project.mkdir()
+
+    settings = project / "settings.toml"
+    settings.write_text('[tool]\nname = "demo"\n')
+    settings.chmod(0o640)
+
+    conserve_script = project / ".conserve.py"
+    conserve_script.write_text("""
+import conserve
+
+def conserve_stage_settings():
+    conserve.TOMLHandle("settings.toml").load().merge({"tool": {"level": 2}}).save()
+    conserve.JSONHandle("out/new.json").replace({"created": True}).save()
+""")
+
+    result = run_cli(project, "apply", "--yes")
+    assert result.returncode == 0
+    assert "Successfully applied changes to 2 file(s)" in result.stdout
+
+    doc = tomllib.loads(settings.read_text())
+    assert doc["tool"]["name"] == "demo"
+    assert doc["tool"]["level"] == 2
+    assert settings.stat().st_mode & 0o777 == 0o640
+    assert json.loads((project / "out" / "new.json").read_text()) == {"created": True}
+    # No temp files left behind
+    assert sorted(p.name for p in project.iterdir()) == [".conserve.py", "out", "settings.toml"]
+
+
+def test_e2e_stage_many(tmp_path):
+    """Batch staging records every original and commits like single stages."""
+    from conserve.plan import Plan
+
+    existing = [tmp_path / f"f{i}.txt" for i in range(5)]
+    for i, path in enumerate(existing):
+        path.write_text(f"old {i}\n")
+    created = tmp_path / "sub" / "new.txt"
+
+    plan = Plan()
+    plan.stage_many([(path, f"new {i}\n") for i, path in enumerate(existing)] + [(created, "fresh\n")])
+
+    diff = plan.get_diff_summary()
+    assert "-old 3" in diff and "+new 3" in diff
+    assert "+fresh" in diff
+    assert plan.get_diff_summary() == diff
+    # Re-staging a path replaces its cached diff
+    plan.stage(existing[3], "old 3\n")
+    assert "+new 3" not in plan.get_diff_summary()
+    plan.stage(existing[3], "new 3\n")
+
+    plan.commit()
+    assert [path.read_text() for path in existing] == [f"new {i}\n" for i in range(5)]
+    assert created.read_text() == "fresh\n"
+
+
+def test_e2e_text_present_absent(tmp_path):
+    """present/absent stay idempotent, including after direct edits to `lines`."""
+    from conserve import TextHandle
+
+    ignore = tmp_path / ".gitignore"
+    ignore.write_text("*.pyc\n.venv/\n*.pyc\n")
+
+    handle = TextHandle(ignore).load()
+    for pattern in ["dist/", ".venv/", "dist/", "build/"]:
+        handle.present(pattern)
+    handle.absent("*.pyc")
+    handle.lines[0] = "node_modules/"  # direct edit, replaces ".venv/"
+    handle.present(".venv/").present("node_modules/")
+    handle.save(stage=False)
+
+    assert ignore.read_text() == "node_modules/\ndist/\nbuild/\n.venv/\n"
+
+
+def test_e2e_yaml_unsaved_edits_stay_private(tmp_path):
+    """Handles sharing a cached YAML parse never see each other's unsaved edits."""
+    from conserve import YAMLHandle
+
+    path = tmp_path / "app.yaml"
+    path.write_text("a: 1\nnested:\n  b: 2\n")
+
+    edited = YAMLHandle(path).load()
+    assert edited.get("nested.b") == 2
+    edited.document["a"] = 42
+    edited.document["nested"]["b"] = 43
+
+    fresh = YAMLHandle(path).load()
+    assert fresh.read() == {"a": 1, "nested": {"b": 2}}
+    assert fresh.get("nested.b") == 2
+    assert edited.read()["a"] == 42
+
+
+def test_e2e_toml_unsaved_edits_stay_private(tmp_path):
+    """Unsaved edits through `document` never reach other handles of the same file."""
+    from conserve import TOMLHandle
+
+    path = tmp_path / "config.toml"
+    path.write_text("[server]\nport = 1  # default\n")
+
+    edited = TOMLHandle(path).load()
+    edited.document["server"]["port"] = 555
+
+    TOMLHandle(path).load().merge({"server": {"host": "localhost"}}).save(stage=False)
+    assert path.read_text() == '[server]\nport = 1  # default\nhost = "localhost"\n'
+    assert TOMLHandle(path).load().get("server.port") == 1
+    assert edited.get("server.port") == 555
+
+
+def test_e2e_toml_malformed_fails_on_load(tmp_path):
+    """A broken TOML file is reported by load(), not silently re-saved."""
+    from conserve import TOMLHandle
+
+    path = tmp_path / "broken.toml"
+    path.write_text("[server\nport = 1\n")
+
+    for preserve_format in (True, False):
+        with pytest.raises(ValueError):
+            TOMLHandle(path, preserve_format=preserve_format).load()
+    assert path.read_text() == "[server\nport = 1\n"
+
+
+def test_e2e_json_float_format_unchanged(tmp_path):
+    """Re-saving JSON keeps the stdlib float spelling (no spurious diffs)."""
+    from conserve import JSONHandle
+
+    path = tmp_path / "data.json"
+    original = json.dumps({"big": 1e100, "small": 1e-07, "ratio": 0.5, "name": "naïve"}, indent=2, ensure_ascii=False)
+    path.write_text(original + "\n")
+
+    handle = JSONHandle(path).load()
+    handle.save(stage=False)
+    assert path.read_text() == original + "\n"
+    handle.merge({"ratio": 0.25}).save(stage=False)
+    assert '"big": 1e+100' in path.read_text()
+    assert '"small": 1e-07' in path.read_text()
+
+
+def test_e2e_diff_merge_formats_like_merge(tmp_path):
+    """diff_merge and merge render the same patch identically (new and replaced lists)."""
+    from conserve import TOMLHandle
+
+    source = '[tool]\nreplaced = ["x"]\nkept = 1\n'
+    patch = {"tool": {"replaced": ["a", "b", "c"], "added": ["d", "e", "f"]}}
+    outputs = []
+    for method in ("merge", "diff_merge"):
+        path = tmp_path / f"{method}.toml"
+        path.write_text(source)
+        getattr(TOMLHandle(path).load(), method)(patch).save(stage=False)
+        outputs.append(path.read_text())
+
+    assert outputs[0] == outputs[1]
+    assert tomllib.loads(outputs[1])["tool"]["added"] == ["d", "e", "f"]
+
+
+def test_e2e_manifest_tracks_helper_modules(tmp_path):
+    """Editing a helper imported by a config file invalidates the task manifest."""
+    project = tmp_path / "helpers"
+    conserve_dir = project / ".conserve"
+    conserve_dir.mkdir(parents=True)
+
+    (conserve_dir / "conserve_tasks.py").write_text("""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from _shared import *  # noqa: F403
+""")
+    helper = conserve_dir / "_shared.py"
+    helper.write_text("def conserve_first():\n    pass\n")
+
+    try:
+        assert "conserve_first" in run_cli(project, "list").stdout
+        manifest = json.loads((conserve_dir / ".cache" / "tasks.json").read_text())
+        assert manifest["modules"] == [".conserve/_shared.py"]
+
+        helper.write_text("def conserve_renamed_task():\n    pass\n")
+        listing = run_cli(project, "list").stdout
+        assert "conserve_renamed_task" in listing
+        assert "conserve_first" not in listing
+    finally:
+        sys.path.remove(str(conserve_dir))
+
+
+def test_e2e_toml_read_fast(tmp_path):
+    """read_fast returns the shared tomllib dict until the handle holds edits."""
+    from conserve import TOMLHandle
+
+    path = tmp_path / "config.toml"
+    path.write_text('[server]\nhost = "localhost"  # dev\nport = 8080\n')
+
+    handle = TOMLHandle(path).load()
+    fast = handle.read_fast()
+    assert fast == handle.read() == {"server": {"host": "localhost", "port": 8080}}
+    # Unchanged file: shared with later handles, no re-parse
+    assert TOMLHandle(path).load().read_fast() is fast
+
+    handle.merge({"server": {"port": 9090}})
+    assert handle.read_fast()["server"]["port"] == 9090
+    assert fast["server"]["port"] == 8080
+
+
+def test_e2e_get_dotted_paths(tmp_path):
+    """get() walks dot-separated paths and returns independent copies."""
+    from conserve import JSONHandle, TOMLHandle, YAMLHandle
+
+    (tmp_path / "c.toml").write_text('[server]\nport = 8080\ntags = ["a"]\n')
+    (tmp_path / "c.yaml").write_text("server:\n  port: 8080\n  tags: [a]\n")
+    (tmp_path / "c.json").write_text('{"server": {"port": 8080, "tags": ["a"]}}\n')
+
+    for handle in (TOMLHandle(tmp_path / "c.toml"), YAMLHandle(tmp_path / "c.yaml"), JSONHandle(tmp_path / "c.json")):
+        handle.load()
+        assert handle.get("server.port") == 8080
+        assert handle.get("server.missing", 1) == 1
+        assert handle.get("server.port.deeper") is None
+        tags = handle.get("server.tags")
+        assert tags == ["a"]
+        tags.append("b")
+        assert handle.get("server.tags") == ["a"]
+
+
+def test_e2e_yaml_plain_mode(tmp_path):
+    """preserve_format=False yields plain containers and drops formatting on save."""
+    from conserve import YAMLHandle
+
+    path = tmp_path / "deploy.yaml"
+    path.write_text("# header\nservice:\n  name: 'web'  # quoted\n  replicas: 2\n")
+
+    handle = YAMLHandle(path, preserve_format=False).load()
+    doc = handle.read()
+    assert doc == {"service": {"name": "web", "replicas": 2}}
+    assert type(doc["service"]) is dict
+
+    handle.merge({"service": {"replicas": 3}}).save(stage=False)
+    assert path.read_text() == "service:\n  name: web\n  replicas: 3\n"
+    # A round-trip handle of the same file is a separate parse
+    assert YAMLHandle(path).load().get("service.replicas") == 3
+
+
+def test_e2e_task_module_dataclasses(tmp_path):
+    """Config modules are registered in sys.modules, so dataclasses with string annotations work."""
+    project = tmp_path / "dataclasses"
+    conserve_dir = project / ".conserve"
+    conserve_dir.mkdir(parents=True)
+
+    (conserve_dir / "conserve_notes.py").write_text("""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+@dataclass
+class Note:
+    text: str
+
+def conserve_write_note():
+    Path("note.txt").write_text(Note("noted").text)
+""")
+
+    result = run_cli(project, "apply", "--yes")
+    assert result.returncode == 0, result.stderr
+    assert (project / "note.txt").read_text() == "noted"
+
+
+def test_e2e_commit_new_files_follow_umask(tmp_path):
+    """New files committed by the write pool get the umask default, and the umask is left alone."""
+    import os
+
+    from conserve.plan import Plan
+
+    previous = os.umask(0o027)
+    try:
+        plan = Plan()
+        plan.stage_many([(tmp_path / f"new{i}.txt", f"{i}\n") for i in range(8)])
+        plan.commit()
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(previous)
+
+    assert {(tmp_path / f"new{i}.txt").stat().st_mode & 0o777 for i in range(8)} == {0o640}
+
+
+def test_e2e_yaml_custom_loader_not_shared(tmp_path):
+    """A handle with its own `yaml` instance never shares parses with default handles."""
+    from conserve import YAMLHandle
+
+    path = tmp_path / "app.yaml"
+    path.write_text("service:\n  name: web\n")
+
+    YAMLHandle(path).load()
+    custom = YAMLHandle(path)
+    custom.yaml = YAML(typ="safe")
+    assert type(custom.load().document["service"]) is dict
+
+    custom.document["service"]["name"] = "api"
+    assert YAMLHandle(path).load().get("service.name") == "web"
+    assert type(YAMLHandle(path).load().document["service"]) is not dict
+
+
+def test_e2e_text_kept_lines_reference(tmp_path):
+    """Same-length edits through a kept `lines` reference are seen by present/absent and save."""
+    from conserve import TextHandle
+
+    ignore = tmp_path / ".gitignore"
+    ignore.write_text("dist/\nbuild/\n")
+
+    handle = TextHandle(ignore).load()
+    lines = handle.lines
+    handle.present("dist/")  # builds the membership index
+    handle.save(stage=False)  # memoizes the dump
+
+    lines[0] = "node_modules/"
+    handle.present("dist/").absent("build/")
+    lines.sort()
+    handle.save(stage=False)
+    assert ignore.read_text() == "dist/\nnode_modules/\n"
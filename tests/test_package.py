@@ -36,6 +36,14 @@ def test_package_creation_colon_with_version():
     assert pkg.type == "pypi"
 
 
+def test_package_of_is_shared():
+    """Package.of memoizes construction per PURL string."""
+    pkg = Package.of("pypi/requests@2.31.0")
+    assert Package.of("pypi/requests@2.31.0") is pkg
+    assert pkg.version == "2.31.0"
+    assert Package.of("pypi/requests") is not pkg
+
+
 def test_package_invalid_type():
     """Test Package creation with unsupported type raises on method call."""
     pkg = Package("invalid-type/package")
@@ -44,6 +52,89 @@ def test_package_invalid_type():
         pkg.latest()
 
 
+def test_gather_info_returns_errors_in_place():
+    """Batch info keeps input order and reports per-package failures."""
+    from conserve.package import gather_info
+
+    results = gather_info([Package("invalid-type/a"), Package("invalid-type/b")])
+    assert len(results) == 2
+    assert all(isinstance(r, ValueError) for r in results)
+    assert gather_info([]) == []
+
+
+def test_gather_info_mixed_results_in_place():
+    """Successes and per-package ValueErrors come back aligned, without network."""
+    from packageurl import PackageURL
+
+    from conserve.package import gather_info
+
+    class FakeProvider:
+        def full_name(self, purl):
+            return purl.name
+
+        def get_version_info(self, name, version):
+            if name == "missing":
+                raise ValueError(f"Version not found: {name}@{version}")
+            return {"version": version}
+
+    packages = [
+        Package._from_purl(PackageURL(type="pypi", name=name, version="1.0"), FakeProvider())
+        for name in ("requests", "missing", "lodash")
+    ]
+    results = gather_info(packages)
+    assert results[0] == {"version": "1.0"}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"version": "1.0"}
+
+
+def test_deps_dev_client_concurrent_init(monkeypatch):
+    """Threads racing on the first DepsDevClient() all get a fully built client."""
+    import threading
+    import time
+
+    from conserve.package import deps_dev_provider
+    from conserve.package.deps_dev_provider import DepsDevClient
+
+    stub_class = deps_dev_provider.InsightsStub
+
+    def slow_stub(channel):
+        time.sleep(0.05)  # Widen the window between "instance exists" and "stub exists"
+        return stub_class(channel)
+
+    monkeypatch.setattr(deps_dev_provider, "InsightsStub", slow_stub)
+    monkeypatch.setattr(DepsDevClient, "_instance", None)
+    monkeypatch.setattr(DepsDevClient, "_channel", None)
+    monkeypatch.setattr(DepsDevClient, "_stub", None)
+
+    barrier = threading.Barrier(4)
+    clients = []
+
+    def build():
+        barrier.wait()
+        client = DepsDevClient()
+        clients.append((client, client._stub))
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client, _ in clients}) == 1
+    assert all(stub is not None for _, stub in clients)
+    clients[0][0].close()
+
+
+@pytest.mark.integration
+def test_gather_info_pypi():
+    """Concurrent info lookups return version metadata per package."""
+    from conserve.package import gather_info
+
+    results = gather_info([Package("pypi/requests@2.31.0"), Package("npm/lodash")])
+    assert results[0]["version"] == "2.31.0"
+    assert results[1]["version"] is not None
+
+
 def test_package_invalid_purl():
     """Test Package creation with invalid PURL format."""
     with pytest.raises(ValueError, match="Invalid PURL format"):
@@ -87,6 +178,17 @@ def test_package_latest_npm():
     assert latest.version is not None
 
 
+@pytest.mark.integration
+def test_deps_dev_latest_versions_batch():
+    """Batch lookup is aligned with input; unknown packages yield None."""
+    from conserve.package.deps_dev_provider import DepsDevProvider
+
+    versions = DepsDevProvider("pypi").get_latest_versions(["requests", "this-package-does-not-exist-xyz"])
+    assert len(versions) == 2
+    assert versions[0] is not None
+    assert versions[1] is None
+
+
 def test_package_creation_github():
     """Test Package creation with GitHub PURL format."""
     pkg = Package("github/pytorch/pytorch")
@@ -160,3 +262,91 @@ def test_to_pypi_from_conda_returns_package():
     target = pkg.to_pypi()
     assert isinstance(target, Package)
     assert target.type == "pypi"
+
+
+def test_deps_dev_version_info_is_disk_cached(package_cache_dir, monkeypatch):
+    """Version metadata is served from the on-disk cache on repeat lookups."""
+    from types import SimpleNamespace
+
+    from conserve.package.deps_dev_provider import DepsDevProvider
+
+    tmp_path = package_cache_dir
+    monkeypatch.delenv("CONSERVE_NO_CACHE", raising=False)
+    calls = []
+
+    def get_version(system, name, version):
+        calls.append((name, version))
+        return SimpleNamespace(is_default=True, licenses=["MIT"], published_at=None, links=[], registries=[])
+
+    provider = DepsDevProvider("pypi")
+    monkeypatch.setattr(provider, "_client", SimpleNamespace(get_version=get_version))
+
+    first = provider.get_version_info("requests", "2.31.0")
+    assert provider.get_version_info("requests", "2.31.0") == first
+    # Keyword arguments bind to the same entry
+    assert provider.get_version_info(name="requests", version="2.31.0") == first
+    assert calls == [("requests", "2.31.0")]
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Name lookups are pure and never touch the cache
+    provider.full_name(Package("pypi/requests")._purl)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_disk_cache_drops_expired_entries(package_cache_dir, monkeypatch):
+    """Expired entries are deleted when read, and stale files are swept."""
+    import os
+    import time
+
+    from conserve.package import _cache
+
+    monkeypatch.delenv("CONSERVE_NO_CACHE", raising=False)
+    monkeypatch.setattr(_cache, "_swept", False)
+    stale = package_cache_dir / "stale.json"
+    stale.write_bytes(b"{}")
+    old = time.time() - _cache._max_ttl - 60
+    os.utime(stale, (old, old))
+
+    class Source:
+        _cache_namespace = "test"
+        fail = False
+
+        @_cache.disk_cache(ttl=0)
+        def lookup(self, name):
+            if self.fail:
+                raise ValueError(name)
+            return name.upper()
+
+    source = Source()
+    assert source.lookup("a") == "A"
+    assert not stale.exists()
+    assert len(list(package_cache_dir.iterdir())) == 1
+
+    # ttl=0: the entry is expired, so reading it deletes it even when the refetch fails
+    source.fail = True
+    with pytest.raises(ValueError):
+        source.lookup("a")
+    assert list(package_cache_dir.iterdir()) == []
+
+
+def test_conda_reverse_sidecars_scoped_per_source(tmp_path, monkeypatch):
+    """Mappers of different sources keep their own reverse maps on disk."""
+    import json
+
+    from conserve.package import conda
+
+    monkeypatch.setattr(conda, "_REVERSE_DIR", tmp_path / "reverse")
+    mappers = []
+    for i, (conda_name, pypi_name) in enumerate([("pytorch", "torch"), ("py-opencv", "opencv-python")]):
+        source = tmp_path / f"mapping{i}.json"
+        source.write_text(json.dumps({conda_name: pypi_name}))
+        mapper_class = type(f"Mapping{i}", (conda._CondaMapping,), {"MAPPING_URL": str(source)})
+        mappers.append(mapper_class())
+
+    assert mappers[0].pypi_to_conda("Torch") == "pytorch"
+    assert mappers[1].pypi_to_conda("opencv_python") == "py-opencv"
+    assert len(list((tmp_path / "reverse").iterdir())) == 2
+
+    mappers[0].clear_cache()
+    assert [p.name.split("-")[0] for p in (tmp_path / "reverse").iterdir()] == [mappers[1]._sidecar_prefix]
+    assert mappers[0].pypi_to_conda("torch") == "pytorch"